@@ -3,208 +3,167 @@
 # Usage: .py
 #
 
-import re
+import os
+import sys
+from array import array
 from functools import wraps
+from math import log2
+from time import perf_counter_ns
 from timeit import default_timer
 
-def timer(func):
-        @wraps(func)
-        def method_wrapper(self, amount):
-            print(f"Calling {func} on {amount}")
-            start = default_timer()
-            func(self, amount)
-            end = default_timer()
-            print(f"Returned from {func} it took {start - end} seconds")
-              
-        return method_wrapper
+from bank_account import core
+from bank_account.core import AmountError, BalanceError, PostingStatus, count_rejection, rejections, reset_rejections
 
-class AmountError(Exception):
-    """Valid amounts must be greater than zero."""
+TIMER_MODES = ('off', 'print', 'record')
 
-    def __init__(self, account, msg) -> None:
-        self.account = account
-        self.msg     = msg
+# Read once at import: in 'off' mode timer() hands back the undecorated
+# method, so production classes carry no wrapper at all.
+timer_mode = os.environ.get('BANK_ACCOUNT_TIMER', 'print')
 
-    def __str__(self) -> str:
-        return f"AmountError(Cannot deposit/withdraw negative amounts) {self.account} {self.msg})"
+def set_timer_mode(mode) -> None:
+    """Switch timer() between printing, recording to histograms and doing nothing.
 
-class BalanceError(Exception):
-    """Withdrawals should not exceed overdraft limit."""
+    Methods decorated while the mode was 'off' stay unwrapped.
+    """
+    global timer_mode
+    if mode not in TIMER_MODES:
+        raise ValueError(f"Invalid timer mode. Mode must be one of the following: {TIMER_MODES}")
+    timer_mode = mode
 
-    def __init__(self, account, msg) -> None:
-        self.account = account
-        self.msg     = msg
+class LatencyHistogram:
 
-    def __str__(self) -> str:
-        return f"BalanceError({self.account} {self.msg})"
-
-class Account:
-
-    """A class to represent a bank account."""
-
-    instance_count = 0
-
-    @classmethod
-    def increment_instance_count(cls):
-        cls.instance_count += 1
+    """A log-bucketed latency histogram with roughly 9% resolution."""
 
-    @staticmethod
-    def static_function():
-        print('Static method')
+    STEPS = 8
 
-    TYPES = ('current', 'savings', 'deposit', 'investment')
+    def __init__(self) -> None:
+        self.buckets = array('Q', bytes(8 * 64 * self.STEPS))
+        self.count   = 0
+        self.max     = 0
 
-    def __init__(self,
-                account_number, 
-                account_holder, 
-                opening_balance, 
-                account_type,
-                transaction) -> None:
+    def record(self, nanoseconds) -> None:
+        self.buckets[int(log2(nanoseconds) * self.STEPS) if nanoseconds > 1 else 0] += 1
+        self.count += 1
+        if nanoseconds > self.max:
+            self.max = nanoseconds
 
-        if not isinstance(account_number, str):
-            raise TypeError(f"Invalid account number. Account number must of type string.")
+    def percentile(self, pct) -> float:
+        """Upper bound of the bucket holding the pct-th percentile, in nanoseconds."""
+        rank = pct / 100 * self.count
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if hits and seen >= rank:
+                return min(2 ** ((index + 1) / self.STEPS), self.max)
+        return 0.0
 
-        if not account_number.isdigit():
-            raise ValueError(f"Invalid account number. Account number must contain only digits.")
+    def summary(self) -> dict:
+        return {'count': self.count,
+                'p50':   self.percentile(50) / 1e9,
+                'p99':   self.percentile(99) / 1e9,
+                'max':   self.max / 1e9}
 
-        if len(account_number) != 6:
-            raise ValueError(f"Invalid account number. Account number must only be of length 6.")
+_timings = {}
 
-        resObj = re.search("^([a-zA-Z]{2,}\s[a-zA-Z]{1,}'?-?[a-zA-Z]{2,}\s?([a-zA-Z]{1,})?)", account_holder)
-        if not resObj: 
-            raise ValueError(f"Invalid account name. Account name must be first name followed by last name.")
+# Per-wrapper caches of the histograms in _timings, cleared with it.
+_histogram_caches = []
 
-        if opening_balance < 0:
-            raise ValueError(f"Opening balance must be positive!")
+def timings() -> dict:
+    """Latency summaries in seconds keyed by (account class, method)."""
+    return {key: histogram.summary() for key, histogram in _timings.items()}
 
-        if account_type not in self.TYPES:
-            raise ValueError(f"Invalid account type. Account must be one of the following: {self.TYPES}")
-                
-        Account.increment_instance_count()
-        self.account_number   = account_number
-        self.account_holder   = account_holder
-        self._opening_balance = opening_balance
-        self.account_type     = account_type
-        self.transaction      = transaction
-        self._index           = 0
+def dump_timings(file=None) -> None:
+    file = file or sys.stdout
+    for (cls, method), stats in sorted(timings().items()):
+        print(f"{cls}.{method}: count={stats['count']} p50={stats['p50']:.3e}s "
+              f"p99={stats['p99']:.3e}s max={stats['max']:.3e}s", file=file)
 
-    def __str__(self) -> str:
-        return f"Account[{self.account_number}] - {self.account_holder}, {self.account_type} account = {self._opening_balance}"
+def reset_timings() -> None:
+    _timings.clear()
+    for cache in _histogram_caches:
+        cache.clear()
 
-    def __repr__(self) -> str:
-        return f"Account('{self.account_number}', '{self.account_holder}', {self._opening_balance}, '{self.account_type}')"
+def timer(func):
+        if timer_mode == 'off':
+            return func
 
-    def __iter__(self):
-        return self
+        # Histograms are looked up by class, so recording builds no key per call.
+        histograms = {}
+        _histogram_caches.append(histograms)
 
-    def __next__(self):
-        if self._index < len(self.transaction):
-            result = self.transaction[self._index]
-            self._index += 1
+        @wraps(func)
+        def method_wrapper(self, amount):
+            if timer_mode == 'record':
+                start   = perf_counter_ns()
+                result  = func(self, amount)
+                elapsed = perf_counter_ns() - start
+                histogram = histograms.get(type(self))
+                if histogram is None:
+                    key = (type(self).__name__, func.__name__)
+                    histogram = histograms[type(self)] = _timings.setdefault(key, LatencyHistogram())
+                histogram.record(elapsed)
+                return result
+            if timer_mode == 'off':
+                return func(self, amount)
+            print(f"Calling {func} on {amount}")
+            start = default_timer()
+            result = func(self, amount)
+            end = default_timer()
+            print(f"Returned from {func} it took {end - start} seconds")
             return result
-        else:
-            raise StopIteration
-        
-    @timer
-    def deposit(self, amount: int) -> None:
-        if isinstance(amount, int) & (amount > 0):
-            self._opening_balance += amount
-        else:
-            raise AmountError(self, "Cannot deposit negative amounts")
-    @timer
-    def withdraw(self, amount: int) -> None:
-        if isinstance(amount, int) & (amount > 0):
-            self._opening_balance -= amount
-        else:
-            raise AmountError(self, "Cannot withdraw negative amounts")
-
-    @property  
-    def get_balance(self):
-        return self._opening_balance
-
-    @get_balance.setter
-    def get_balance(self, value):
-        if isinstance(value, int) & (value > 0):
-            self._opening_balance = value
-
-class CurrentAccount(Account):
 
-    """A subclass to represent a current account"""
-
-    def __init__(self, account_number, account_holder, opening_balance, overdraft_limit, transaction) -> None:
-        super().__init__(account_number, account_holder, opening_balance, 'current', transaction)
-        self.overdraft_limit = overdraft_limit
-
-    def __str__(self) -> str:
-        return f"CurrentAccount[{self.account_number}] - {self.account_holder}, account = {self._opening_balance}, overdraft limit = {self.overdraft_limit}"
-
-    def __repr__(self) -> str:
-        return f"CurrentAccount('{self.account_number}', '{self.account_holder}', {self._opening_balance}, {self.overdraft_limit})"
-
-    @timer
-    def deposit(self, amount: int) -> None:
-        if isinstance(amount, int) & (amount > 0):
-            self._opening_balance += amount
-        else:
-            raise AmountError(self, "Cannot deposit negative amounts")
-
-    @timer
-    def withdraw(self, amount: int) -> None:
-        if self._opening_balance - amount < self.overdraft_limit:
-            raise BalanceError(self, "Cannot excced your overdraft limit!")
-        else:
-            if isinstance(amount, int) & (amount > 0):
-                self._opening_balance -= amount
-            else:
-                raise AmountError(self, "Cannot withdraw negative amounts")
-
-class DepositAccount(Account):
-
-    """A subclass to represent a deposit account"""
-
-    def __init__(self, account_number, account_holder, opening_balance, interest_rate, transaction) -> None:
-        super().__init__(account_number, account_holder, opening_balance, 'deposit', transaction)
-        self.interest_rate = interest_rate
-
-    def __str__(self) -> str:
-        return f"DepositAccount[{self.account_number}] - {self.account_holder}, account = {self._opening_balance}, interest rate = {self.interest_rate}"
-
-    def __repr__(self) -> str:
-        return f"DepositAccount('{self.account_number}', '{self.account_holder}', {self._opening_balance}, {self.interest_rate})"
-        
-    def interest(self):
-        return self._opening_balance * self.interest_rate
-
-class InvestmentAccount(Account):
+        return method_wrapper
 
-    """A subclass to represent an investment account"""
+class Account(core.Account):
 
-    RISK_TYPES = ('low', 'medium', 'high')
+    """A class to represent a bank account."""
 
-    def __init__(self, account_number, account_holder, opening_balance, risk_level, transaction) -> None:
-        super().__init__(account_number, account_holder, opening_balance, 'investment', transaction)
-        self.risk_level = risk_level
+    instance_count = 0
 
-        if risk_level not in self.RISK_TYPES:
-            raise ValueError(f"Invalid risk type. Account must be one of the following: {self.RISK_TYPES}")
+    @classmethod
+    def increment_instance_count(cls):
+        Account.instance_count += 1
 
-    def __str__(self) -> str:
-        return f"InvestmentAccount[{self.account_number}] - {self.account_holder}, account = {self._opening_balance}, risk level = {self.risk_level}"
+    def __init__(self,
+                account_number, 
+                account_holder, 
+                opening_balance, 
+                account_type,
+                transaction=()) -> None:
+        super().__init__(account_number, account_holder, opening_balance, account_type)
+        self.transaction = transaction
 
-    def __repr__(self) -> str:
-        return f"InvestmentAccount('{self.account_number}', '{self.account_holder}', {self._opening_balance}, {self.risk_level})"
+    def __iter__(self):
+        yield from self.transaction
 
+    deposit      = timer(core.Account.deposit)
+    withdraw     = timer(core.Account.withdraw)
+    try_deposit  = timer(core.Account.try_deposit)
+    try_withdraw = timer(core.Account.try_withdraw)
 
-      
+class CurrentAccount(core.CurrentAccount, Account):
 
+    """A subclass to represent a current account"""
 
+    def __init__(self, account_number, account_holder, opening_balance, overdraft_limit, transaction=()) -> None:
+        super().__init__(account_number, account_holder, opening_balance, overdraft_limit)
+        self.transaction = transaction
 
+    withdraw     = timer(core.CurrentAccount.withdraw)
+    try_withdraw = timer(core.CurrentAccount.try_withdraw)
 
+class DepositAccount(core.DepositAccount, Account):
 
-    
-    
+    """A subclass to represent a deposit account"""
 
+    def __init__(self, account_number, account_holder, opening_balance, interest_rate, transaction=()) -> None:
+        super().__init__(account_number, account_holder, opening_balance, interest_rate)
+        self.transaction = transaction
 
+class InvestmentAccount(core.InvestmentAccount, Account):
 
+    """A subclass to represent an investment account"""
 
-    
+    def __init__(self, account_number, account_holder, opening_balance, risk_level, transaction=()) -> None:
+        super().__init__(account_number, account_holder, opening_balance, risk_level)
+        self.transaction = transaction
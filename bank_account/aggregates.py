@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# Portfolio totals kept up to date as postings happen, so dashboards read
+# them in O(1) instead of re-summing every account on each poll.
+#
+
+from threading import Lock
+
+from bank_account.money import to_major
+
+# Indexes into each aggregate row: total balance, number of accounts and
+# overdraft exposure (the amount drawn below zero), all in minor units.
+BALANCE  = 0
+COUNT    = 1
+EXPOSURE = 2
+
+class PortfolioAggregates:
+
+    """Balance, count and overdraft exposure per account type and per risk level.
+
+    Accounts are included with add(), or automatically when attach() is used
+    on an account class before its accounts are created. Every posting then
+    updates the totals by its delta, through the class observers or the
+    account's subscribers.
+    """
+
+    def __init__(self, accounts=()) -> None:
+        self._by_type = {}
+        self._by_risk = {}
+        self._lock    = Lock()
+        for account in accounts:
+            self.add(account)
+
+    def attach(self, target) -> None:
+        """Aggregate every account created from an account class from now on."""
+        target.openers = target.openers + (self._include,)
+        target.observers = target.observers + (self._posted,)
+
+    def detach(self, target) -> None:
+        target.openers = tuple(opener for opener in target.openers if opener != self._include)
+        target.observers = tuple(observer for observer in target.observers if observer != self._posted)
+
+    def add(self, account) -> None:
+        """Aggregate a single existing account and follow its postings."""
+        self._include(account)
+        account.subscribe(self._posted)
+
+    def snapshot(self) -> dict:
+        """A consistent copy of the aggregates, in major units.
+
+        {'by_type': {account_type: {'balance', 'count', 'exposure'}},
+         'by_risk': {risk_level: {...}}}
+        """
+        with self._lock:
+            return {'by_type': _export(self._by_type), 'by_risk': _export(self._by_risk)}
+
+    def verify(self, accounts) -> list:
+        """Recompute from scratch and return (group, key, field, expected, actual) for each drift."""
+        expected = PortfolioAggregates()
+        for account in accounts:
+            expected._include(account)
+        current = self.snapshot()
+        drift   = []
+        for group, rows in expected.snapshot().items():
+            for key in rows.keys() | current[group].keys():
+                want = rows.get(key, _EMPTY)
+                have = current[group].get(key, _EMPTY)
+                drift.extend((group, key, field, want[field], have[field])
+                             for field in want if want[field] != have[field])
+        return drift
+
+    def _include(self, account) -> None:
+        balance  = account.minor_balance
+        exposure = -balance if balance < 0 else 0
+        with self._lock:
+            for row in self._rows(account):
+                row[BALANCE]  += balance
+                row[COUNT]    += 1
+                row[EXPOSURE] += exposure
+
+    def _posted(self, account, amount) -> None:
+        balance = account.minor_balance
+        before  = balance - amount
+        change  = (-balance if balance < 0 else 0) - (-before if before < 0 else 0)
+        with self._lock:
+            for row in self._rows(account):
+                row[BALANCE]  += amount
+                row[EXPOSURE] += change
+
+    def _rows(self, account):
+        rows = [_row(self._by_type, account.account_type)]
+        if account.account_type == 'investment':
+            rows.append(_row(self._by_risk, account.risk_level))
+        return rows
+
+def _row(rows, key) -> list:
+    row = rows.get(key)
+    if row is None:
+        row = rows[key] = [0, 0, 0]
+    return row
+
+_EMPTY = {'balance': 0, 'count': 0, 'exposure': 0}
+
+def _export(rows) -> dict:
+    return {key: {'balance':  to_major(row[BALANCE]),
+                  'count':    row[COUNT],
+                  'exposure': to_major(row[EXPOSURE])} for key, row in rows.items()}
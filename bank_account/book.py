@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+from array import array
+
+from bank_account.money import Money, posting_units, to_major, to_minor
+from bank_account.validation import validate
+from bank_account.account import Account, InvestmentAccount, AmountError, BalanceError, PostingStatus, count_rejection
+
+# Range of the int64 balance and limit columns, in minor units.
+MINOR_MIN = -2**63
+MINOR_MAX = 2**63 - 1
+
+class AccountBook:
+
+    """A columnar container holding many accounts in parallel typed arrays.
+
+    Balances and overdraft limits are stored in minor units. As with
+    Account.observers, each observer is called as observer(view, amount) in
+    signed minor units after every posting through a view or post_batch.
+    Subscribers of a single view are kept per row and are called after them.
+    """
+
+    CAPACITY  = 1_000_000
+    observers = ()
+
+    def __init__(self) -> None:
+        self.numbers  = array('i')
+        self.balances = array('q')
+        self.limits   = array('q')
+        self.rates    = array('d')
+        self.types    = array('b')
+        self.risks    = array('b')
+        self.holders  = []
+        self.versions = array('Q')
+        self.sequence = 0
+        self._rows    = array('i', [-1]) * self.CAPACITY
+        self._subscribers = {}
+
+    @classmethod
+    def from_accounts(cls, accounts):
+        book = cls()
+        for account in accounts:
+            book.add(account)
+        return book
+
+    def open(self,
+             account_number,
+             account_holder,
+             opening_balance,
+             account_type,
+             overdraft_limit=0,
+             interest_rate=0.0,
+             risk_level=None):
+
+        validate(account_number, account_holder, opening_balance, account_type)
+
+        if account_type == 'investment' and risk_level not in InvestmentAccount.RISK_TYPES:
+            raise ValueError(f"Invalid risk type. Account must be one of the following: {InvestmentAccount.RISK_TYPES}")
+
+        # Everything is converted and range-checked before any column changes,
+        # so a failed open() never leaves a partly written row.
+        balance = to_minor(opening_balance)
+        limit   = to_minor(overdraft_limit)
+        if not (MINOR_MIN <= balance <= MINOR_MAX and MINOR_MIN <= limit <= MINOR_MAX):
+            raise ValueError(f"Invalid amount. Balances and limits must fit in 64-bit minor units.")
+        try:
+            rate = float(interest_rate)
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Invalid interest rate {interest_rate!r}. Interest rate must be a number.") from None
+        number = int(account_number)
+        if self._rows[number] != -1:
+            raise ValueError(f"Account number {account_number} is already in the book.")
+
+        self._append(number,
+                     account_holder,
+                     balance,
+                     limit,
+                     rate,
+                     Account.TYPES.index(account_type),
+                     InvestmentAccount.RISK_TYPES.index(risk_level) if risk_level else -1)
+        return self[account_number]
+
+    def _append(self, number, account_holder, balance, limit, interest_rate, type_code, risk_code) -> None:
+        """Add a row that has already been validated; amounts are in minor units."""
+        row = len(self.numbers)
+        self.numbers.append(number)
+        self.balances.append(balance)
+        self.limits.append(limit)
+        self.rates.append(interest_rate)
+        self.types.append(type_code)
+        self.risks.append(risk_code)
+        self.holders.append(account_holder)
+        self.sequence += 1
+        self.versions.append(self.sequence)
+        # Last, so the number only resolves once every column holds the row.
+        self._rows[number] = row
+
+    def add(self, account):
+        """Copy an already validated account object into the book."""
+        account_type = account.account_type
+        return self.open(account.account_number,
+                         account.account_holder,
+                         Money(account.minor_balance),
+                         account_type,
+                         overdraft_limit=account.overdraft_limit if account_type == 'current' else 0,
+                         interest_rate=account.interest_rate if account_type == 'deposit' else 0.0,
+                         risk_level=account.risk_level if account_type == 'investment' else None)
+
+    def touch(self, row) -> None:
+        """Stamp a row as changed so incremental consumers pick it up."""
+        self.sequence += 1
+        self.versions[row] = self.sequence
+
+    def _overflows(self, row, units) -> bool:
+        """Count and report a posting that would take a balance outside the int64 column."""
+        if MINOR_MIN <= self.balances[row] + units <= MINOR_MAX:
+            return False
+        count_rejection(PostingStatus.INVALID_AMOUNT, Account.TYPES[self.types[row]])
+        return True
+
+    def _post(self, row, units) -> None:
+        if self._overflows(row, units):
+            raise AmountError(_VIEWS[self.types[row]](self, row), "Cannot post amounts beyond the balance range")
+        self.balances[row] += units
+        self.touch(row)
+        if self.observers or self._subscribers:
+            self._notify(row, units)
+
+    def _notify(self, row, units) -> None:
+        view = _VIEWS[self.types[row]](self, row)
+        for observer in self.observers:
+            observer(view, units)
+        for subscriber in self._subscribers.get(row, ()):
+            subscriber(view, units)
+
+    def changed_since(self, sequence):
+        """Rows modified after the given sequence number."""
+        return [row for row, version in enumerate(self.versions) if version > sequence]
+
+    def row(self, account_number) -> int:
+        number = int(account_number)
+        row    = self._rows[number] if 0 <= number < self.CAPACITY else -1
+        if row == -1:
+            raise KeyError(account_number)
+        return row
+
+    def post_batch(self, account_numbers, amounts, minor=False):
+        """Apply signed amounts (deposits positive, withdrawals negative) in one pass.
+
+        Amounts follow deposit()/withdraw(): ints are major units and Money is
+        minor units. With minor=True every int is taken as minor units, which
+        suits amounts read from journals or array('q') columns.
+        Rows are applied in order, so several postings to one account see each
+        other's effect. Rejected rows leave the balance untouched and are
+        reported in the returned array of PostingStatus codes; a posting that
+        would take a balance outside the int64 column is INVALID_AMOUNT.
+        Observers are called for each posted row as it is applied.
+        """
+        if len(account_numbers) != len(amounts):
+            raise ValueError(f"Batch columns must be of equal length.")
+
+        rows     = self._rows
+        balances = self.balances
+        limits   = self.limits
+        types    = self.types
+        versions = self.versions
+        sequence = self.sequence
+        capacity = self.CAPACITY
+        current  = _CURRENT
+        notify   = self._notify if self.observers or self._subscribers else None
+        status   = array('b', bytes(len(amounts)))
+
+        for i, (number, amount) in enumerate(zip(account_numbers, amounts)):
+            number = int(number)
+            row = rows[number] if 0 <= number < capacity else -1
+            units = (amount if isinstance(amount, int) else 0) if minor else posting_units(amount)
+            if row == -1:
+                status[i] = PostingStatus.UNKNOWN_ACCOUNT
+            elif units == 0:
+                status[i] = PostingStatus.INVALID_AMOUNT
+            elif units < 0 and types[row] == current and balances[row] + units < limits[row]:
+                status[i] = PostingStatus.OVERDRAFT_LIMIT
+            elif not MINOR_MIN <= balances[row] + units <= MINOR_MAX:
+                # The balance column is int64; reject rather than overflow midway.
+                status[i] = PostingStatus.INVALID_AMOUNT
+            else:
+                balances[row] += units
+                sequence += 1
+                versions[row] = sequence
+                if notify:
+                    # Observers may read or touch the book, so keep it current.
+                    self.sequence = sequence
+                    notify(row, units)
+        self.sequence = sequence
+        return status
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __contains__(self, account_number) -> bool:
+        number = int(account_number)
+        return 0 <= number < self.CAPACITY and self._rows[number] != -1
+
+    def __getitem__(self, account_number):
+        row = self.row(account_number)
+        return _VIEWS[self.types[row]](self, row)
+
+    def __iter__(self):
+        for row, code in enumerate(self.types):
+            yield _VIEWS[code](self, row)
+
+class AccountView:
+
+    """A thin view over one row of an AccountBook with the Account API."""
+
+    __slots__ = ('_book', '_row')
+
+    def __init__(self, book, row) -> None:
+        self._book = book
+        self._row  = row
+
+    # Views are created on every lookup, so two views of one row are equal.
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AccountView):
+            return NotImplemented
+        return self._book is other._book and self._row == other._row
+
+    def __hash__(self) -> int:
+        return hash((id(self._book), self._row))
+
+    @property
+    def subscribers(self) -> tuple:
+        return self._book._subscribers.get(self._row, ())
+
+    def subscribe(self, subscriber) -> None:
+        """Call subscriber(view, signed_minor_units) after every posting on this row."""
+        self._book._subscribers[self._row] = self.subscribers + (subscriber,)
+
+    def unsubscribe(self, subscriber) -> None:
+        subscribers = tuple(callback for callback in self.subscribers if callback != subscriber)
+        if subscribers:
+            self._book._subscribers[self._row] = subscribers
+        else:
+            self._book._subscribers.pop(self._row, None)
+
+    @property
+    def account_number(self) -> str:
+        return f"{self._book.numbers[self._row]:06d}"
+
+    @property
+    def account_holder(self) -> str:
+        return self._book.holders[self._row]
+
+    @property
+    def account_type(self) -> str:
+        return Account.TYPES[self._book.types[self._row]]
+
+    @property
+    def minor_balance(self) -> int:
+        return self._book.balances[self._row]
+
+    def __str__(self) -> str:
+        return f"Account[{self.account_number}] - {self.account_holder}, {self.account_type} account = {self.get_balance}"
+
+    def __repr__(self) -> str:
+        return f"Account('{self.account_number}', '{self.account_holder}', {self.get_balance}, '{self.account_type}')"
+
+    def deposit(self, amount: int) -> None:
+        units = posting_units(amount)
+        if units > 0:
+            self._book._post(self._row, units)
+        else:
+            count_rejection(PostingStatus.INVALID_AMOUNT, self.account_type)
+            raise AmountError(self, "Cannot deposit negative amounts")
+
+    def withdraw(self, amount: int) -> None:
+        units = posting_units(amount)
+        if units > 0:
+            self._book._post(self._row, -units)
+        else:
+            count_rejection(PostingStatus.INVALID_AMOUNT, self.account_type)
+            raise AmountError(self, "Cannot withdraw negative amounts")
+
+    def try_deposit(self, amount: int) -> PostingStatus:
+        units = posting_units(amount)
+        if units <= 0:
+            count_rejection(PostingStatus.INVALID_AMOUNT, self.account_type)
+            return PostingStatus.INVALID_AMOUNT
+        if self._book._overflows(self._row, units):
+            return PostingStatus.INVALID_AMOUNT
+        self._book._post(self._row, units)
+        return PostingStatus.POSTED
+
+    def try_withdraw(self, amount: int) -> PostingStatus:
+        units = posting_units(amount)
+        if units <= 0:
+            count_rejection(PostingStatus.INVALID_AMOUNT, self.account_type)
+            return PostingStatus.INVALID_AMOUNT
+        if self._book._overflows(self._row, -units):
+            return PostingStatus.INVALID_AMOUNT
+        self._book._post(self._row, -units)
+        return PostingStatus.POSTED
+
+    @property
+    def get_balance(self):
+        return to_major(self._book.balances[self._row])
+
+    @get_balance.setter
+    def get_balance(self, value):
+        if isinstance(value, int) & (value > 0):
+            # Posted as a delta, so book observers see the change.
+            delta = to_minor(value) - self._book.balances[self._row]
+            if delta:
+                self._book._post(self._row, delta)
+
+class CurrentAccountView(AccountView):
+
+    """A view over a current account row"""
+
+    __slots__ = ()
+
+    @property
+    def overdraft_limit(self):
+        return to_major(self._book.limits[self._row])
+
+    def __str__(self) -> str:
+        return f"CurrentAccount[{self.account_number}] - {self.account_holder}, account = {self.get_balance}, overdraft limit = {self.overdraft_limit}"
+
+    def __repr__(self) -> str:
+        return f"CurrentAccount('{self.account_number}', '{self.account_holder}', {self.get_balance}, {self.overdraft_limit})"
+
+    def withdraw(self, amount: int) -> None:
+        units = posting_units(amount)
+        if units <= 0:
+            count_rejection(PostingStatus.INVALID_AMOUNT, 'current')
+            raise AmountError(self, "Cannot withdraw negative amounts")
+        book = self._book
+        if book.balances[self._row] - units < book.limits[self._row]:
+            count_rejection(PostingStatus.OVERDRAFT_LIMIT, 'current')
+            raise BalanceError(self, "Cannot excced your overdraft limit!")
+        book._post(self._row, -units)
+
+    def try_withdraw(self, amount: int) -> PostingStatus:
+        units = posting_units(amount)
+        if units <= 0:
+            count_rejection(PostingStatus.INVALID_AMOUNT, 'current')
+            return PostingStatus.INVALID_AMOUNT
+        book = self._book
+        if book.balances[self._row] - units < book.limits[self._row]:
+            count_rejection(PostingStatus.OVERDRAFT_LIMIT, 'current')
+            return PostingStatus.OVERDRAFT_LIMIT
+        if book._overflows(self._row, -units):
+            return PostingStatus.INVALID_AMOUNT
+        book._post(self._row, -units)
+        return PostingStatus.POSTED
+
+class DepositAccountView(AccountView):
+
+    """A view over a deposit account row"""
+
+    __slots__ = ()
+
+    @property
+    def interest_rate(self):
+        return self._book.rates[self._row]
+
+    def __str__(self) -> str:
+        return f"DepositAccount[{self.account_number}] - {self.account_holder}, account = {self.get_balance}, interest rate = {self.interest_rate}"
+
+    def __repr__(self) -> str:
+        return f"DepositAccount('{self.account_number}', '{self.account_holder}', {self.get_balance}, {self.interest_rate})"
+
+    def interest(self):
+        return self.get_balance * self.interest_rate
+
+class InvestmentAccountView(AccountView):
+
+    """A view over an investment account row"""
+
+    __slots__ = ()
+
+    @property
+    def risk_level(self) -> str:
+        return InvestmentAccount.RISK_TYPES[self._book.risks[self._row]]
+
+    def __str__(self) -> str:
+        return f"InvestmentAccount[{self.account_number}] - {self.account_holder}, account = {self.get_balance}, risk level = {self.risk_level}"
+
+    def __repr__(self) -> str:
+        return f"InvestmentAccount('{self.account_number}', '{self.account_holder}', {self.get_balance}, {self.risk_level})"
+
+_CURRENT = Account.TYPES.index('current')
+
+# Indexed by the position of the account type in Account.TYPES.
+_VIEWS = (CurrentAccountView, AccountView, DepositAccountView, InvestmentAccountView)
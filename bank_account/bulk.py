@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# Streaming import and export of account master data and transactions.
+#
+# CSV files are read in chunks. Each chunk is validated with record_error,
+# which returns failures instead of raising them, and the accepted rows are
+# appended straight into AccountBook columns. Rejected rows, together with
+# their line number and reason, go to an optional side CSV.
+#
+# The columnar binary format for accounts is the snapshot format (see
+# bank_account.snapshot). For transactions it is the journal format (see
+# bank_account.journal).
+#
+
+import csv
+from array import array
+from itertools import islice
+
+from bank_account.book import MINOR_MAX, MINOR_MIN, AccountBook
+from bank_account.journal import DEPOSIT, RECORD, WITHDRAWAL
+from bank_account.money import Money, to_minor
+from bank_account.snapshot import Checkpointer, load
+from bank_account.validation import TYPES, account_number_error, record_error
+from bank_account.account import InvestmentAccount, PostingStatus
+
+ACCOUNT_FIELDS     = ('account_number', 'account_holder', 'opening_balance', 'account_type',
+                      'overdraft_limit', 'interest_rate', 'risk_level')
+TRANSACTION_FIELDS = ('account_number', 'amount', 'timestamp')
+
+CHUNK_SIZE = 10_000
+
+def import_accounts(path, book=None, rejects=None, chunk_size=CHUNK_SIZE):
+    """Load accounts from a CSV with ACCOUNT_FIELDS columns into an AccountBook.
+
+    Returns (book, loaded, rejected). Rows whose account number is already
+    in the book, or appears earlier in the file, are rejected.
+    """
+    book = AccountBook() if book is None else book
+    loaded, rejected = 0, 0
+    with _RejectWriter(rejects, ACCOUNT_FIELDS) as reject:
+        for line, chunk in _chunks(path, chunk_size):
+            for line, row in enumerate(chunk, line):
+                account, error = _account_record(book, row)
+                if error is None:
+                    book._append(*account)
+                    loaded += 1
+                else:
+                    reject(line, row, error)
+                    rejected += 1
+    return book, loaded, rejected
+
+def export_accounts(book, path) -> int:
+    """Write every account in the book as CSV; amounts are in major units."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(ACCOUNT_FIELDS)
+        for row, number in enumerate(book.numbers):
+            account_type = book.types[row]
+            risk_code    = book.risks[row]
+            writer.writerow((f"{number:06d}",
+                             book.holders[row],
+                             Money(book.balances[row]),
+                             TYPES[account_type],
+                             Money(book.limits[row]) if TYPES[account_type] == 'current' else '',
+                             book.rates[row] if TYPES[account_type] == 'deposit' else '',
+                             InvestmentAccount.RISK_TYPES[risk_code] if risk_code >= 0 else ''))
+    return len(book)
+
+def export_accounts_binary(book, path) -> int:
+    """Write the book in the columnar snapshot format."""
+    return Checkpointer(book, path).snapshot()
+
+def import_accounts_binary(path) -> AccountBook:
+    return load(path)
+
+def import_transactions(path, book, rejects=None, journal=None, chunk_size=CHUNK_SIZE):
+    """Post signed major-unit amounts from a CSV with TRANSACTION_FIELDS columns.
+
+    Each chunk is applied with AccountBook.post_batch. Accepted postings are
+    also appended to journal when one is given, with the row's timestamp (ns
+    since the epoch) or the current time when the column is empty. Returns
+    (posted, rejected).
+    """
+    posted, rejected = 0, 0
+    with _RejectWriter(rejects, TRANSACTION_FIELDS) as reject:
+        for line, chunk in _chunks(path, chunk_size):
+            numbers = array('i')
+            amounts = array('q')
+            times   = []
+            rows    = []
+            for line, row in enumerate(chunk, line):
+                number, amount, timestamp, error = _transaction_record(row)
+                if error is None:
+                    numbers.append(number)
+                    amounts.append(amount)
+                    times.append(timestamp)
+                    rows.append((line, row))
+                else:
+                    reject(line, row, error)
+                    rejected += 1
+
+            status = book.post_batch(numbers, amounts, minor=True)
+            for i, code in enumerate(status):
+                if code == PostingStatus.POSTED:
+                    posted += 1
+                    if journal is not None:
+                        amount = amounts[i]
+                        journal.append(numbers[i], DEPOSIT if amount > 0 else WITHDRAWAL, abs(amount), times[i])
+                else:
+                    reject(*rows[i], PostingStatus(code).name)
+                    rejected += 1
+    return posted, rejected
+
+def export_transactions(journal_path, path) -> int:
+    """Convert a binary journal to CSV with signed major-unit amounts."""
+    count = 0
+    with open(journal_path, 'rb') as source, open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(TRANSACTION_FIELDS)
+        while True:
+            data = source.read(RECORD.size * CHUNK_SIZE)
+            # A torn record at the end of the journal is ignored, as in replay().
+            data = data[:len(data) - len(data) % RECORD.size]
+            if not data:
+                break
+            writer.writerows((f"{number:06d}", Money(amount if kind == DEPOSIT else -amount), timestamp)
+                             for number, kind, amount, timestamp in RECORD.iter_unpack(data))
+            count += len(data) // RECORD.size
+    return count
+
+def _chunks(path, chunk_size):
+    """(line number of the first row, rows) for each chunk of a CSV, after its header."""
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        line = 2
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if not chunk:
+                break
+            yield line, chunk
+            line += len(chunk)
+
+def _minor(text):
+    """Minor units for a major-unit string, or None when it is not a valid amount for the int64 columns."""
+    try:
+        # isdigit() alone also accepts digits such as '²' that int() rejects.
+        minor = int(text) * 100 if text.isascii() and text.isdigit() else to_minor(text)
+    except ValueError:
+        return None
+    return minor if MINOR_MIN <= minor <= MINOR_MAX else None
+
+def _account_record(book, row):
+    """(arguments for AccountBook._append, None), or (None, reason) for a rejected row."""
+    if len(row) < 4:
+        return None, f"Expected at least 4 columns, got {len(row)}."
+    account_number, account_holder, opening_balance, account_type, *extra = row
+    overdraft_limit, interest_rate, risk_level = (extra + ['', '', ''])[:3]
+
+    balance = _minor(opening_balance)
+    if balance is None:
+        return None, f"Invalid opening balance {opening_balance!r}."
+    error = record_error(account_number, account_holder, balance, account_type)
+    if error:
+        return None, str(error)
+
+    number = int(account_number)
+    if book._rows[number] != -1:
+        return None, f"Account number {account_number} is already in the book."
+
+    limit, rate, risk_code = 0, 0.0, -1
+    if account_type == 'current':
+        limit = _minor(overdraft_limit or '0')
+        if limit is None:
+            return None, f"Invalid overdraft limit {overdraft_limit!r}."
+    elif account_type == 'deposit':
+        try:
+            rate = float(interest_rate or 0)
+        except ValueError:
+            return None, f"Invalid interest rate {interest_rate!r}."
+    elif account_type == 'investment':
+        if risk_level not in InvestmentAccount.RISK_TYPES:
+            return None, f"Invalid risk type. Account must be one of the following: {InvestmentAccount.RISK_TYPES}"
+        risk_code = InvestmentAccount.RISK_TYPES.index(risk_level)
+
+    return (number, account_holder, balance, limit, rate, TYPES.index(account_type), risk_code), None
+
+def _transaction_record(row):
+    """(account number, signed minor units, timestamp or None, None), or (None, None, None, reason) for a rejected row."""
+    if len(row) < 2:
+        return None, None, None, f"Expected at least 2 columns, got {len(row)}."
+    error = account_number_error(row[0])
+    if error:
+        return None, None, None, str(error)
+    amount = _minor(row[1])
+    if not amount:
+        return None, None, None, PostingStatus.INVALID_AMOUNT.name
+    timestamp = row[2] if len(row) > 2 else ''
+    if not timestamp:
+        return int(row[0]), amount, None, None
+    if not (timestamp.isascii() and timestamp.isdigit() and int(timestamp) < 2**63):
+        return None, None, None, f"Invalid timestamp {timestamp!r}."
+    return int(row[0]), amount, int(timestamp), None
+
+class _RejectWriter:
+
+    """Writes rejected rows to a side CSV, or discards them when no path is given."""
+
+    def __init__(self, path, fields) -> None:
+        self.path   = path
+        self.fields = fields
+        self._file  = None
+
+    def __enter__(self):
+        if self.path is not None:
+            self._file   = open(self.path, 'w', newline='')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(('line',) + self.fields + ('error',))
+        return self
+
+    def __exit__(self, *args):
+        if self._file is not None:
+            self._file.close()
+        return False
+
+    def __call__(self, line, row, error) -> None:
+        if self._file is not None:
+            padding = [''] * (len(self.fields) - len(row))
+            self._writer.writerow([line] + list(row) + padding + [error])
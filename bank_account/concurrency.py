@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import threading
+from array import array
+from contextlib import contextmanager
+
+class AccountLocks:
+
+    """Striped per-account locks for posting to accounts from many threads.
+
+    Accounts hash onto a fixed number of stripes by account number, so
+    unrelated accounts rarely share a lock and post in parallel. Multi-account
+    operations take their stripes in ascending order, which rules out deadlock.
+    """
+
+    def __init__(self, stripes=64) -> None:
+        if stripes < 1:
+            raise ValueError(f"Lock stripes must be a positive integer.")
+        self.stripes    = stripes
+        self._locks     = [threading.Lock() for _ in range(stripes)]
+        self._contended = array('Q', bytes(8 * stripes))
+
+    def stripe(self, account) -> int:
+        return int(account.account_number) % self.stripes
+
+    @property
+    def contention(self) -> int:
+        """Number of acquisitions that had to wait for another thread."""
+        return sum(self._contended)
+
+    def contention_by_stripe(self) -> list:
+        return list(self._contended)
+
+    @contextmanager
+    def locked(self, *accounts):
+        stripes = sorted({self.stripe(account) for account in accounts})
+        for stripe in stripes:
+            self._acquire(stripe)
+        try:
+            yield
+        finally:
+            for stripe in reversed(stripes):
+                self._locks[stripe].release()
+
+    def deposit(self, account, amount) -> None:
+        with self.locked(account):
+            account.deposit(amount)
+
+    def withdraw(self, account, amount) -> None:
+        with self.locked(account):
+            account.withdraw(amount)
+
+    def transfer(self, source, target, amount) -> None:
+        """Move amount between two accounts as one step visible to other lock holders."""
+        with self.locked(source, target):
+            source.withdraw(amount)
+            try:
+                target.deposit(amount)
+            except Exception:
+                source.deposit(amount)
+                raise
+
+    def _acquire(self, stripe) -> None:
+        lock = self._locks[stripe]
+        if not lock.acquire(blocking=False):
+            lock.acquire()
+            # Counted while holding the lock, so no increments are lost.
+            self._contended[stripe] += 1
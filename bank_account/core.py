@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# The account hierarchy shared by bank_account.account, bank_account.slotted
+# and fintech.accounts. Those modules are thin façades that add their own
+# extras (transaction history and timing, __getattr__ and the context
+# manager, typo-safe attributes) on top of these classes. Optimisations to
+# validation, storage or posting only need to be made here.
+#
+
+from collections import Counter
+from enum import IntEnum
+
+from bank_account.money import posting_units, to_major, to_minor
+from bank_account.validation import validate_account_number, validate_account_holder
+
+class AmountError(Exception):
+    """Valid amounts must be greater than zero."""
+
+    def __init__(self, account, msg) -> None:
+        self.account = account
+        self.msg     = msg
+
+    def __str__(self) -> str:
+        return f"AmountError(Cannot deposit/withdraw negative amounts) {self.account} {self.msg})"
+
+class BalanceError(Exception):
+    """Withdrawals should not exceed overdraft limit."""
+
+    def __init__(self, account, msg) -> None:
+        self.account = account
+        self.msg     = msg
+
+    def __str__(self) -> str:
+        return f"BalanceError({self.account} {self.msg})"
+
+class PostingStatus(IntEnum):
+    """Outcome of a single posting when rejections are reported rather than raised."""
+
+    POSTED          = 0
+    INVALID_AMOUNT  = 1
+    OVERDRAFT_LIMIT = 2
+    UNKNOWN_ACCOUNT = 3
+
+# Members cached as module globals: attribute lookups on an Enum class are
+# slow enough to show up on the posting path.
+POSTED          = PostingStatus.POSTED
+INVALID_AMOUNT  = PostingStatus.INVALID_AMOUNT
+OVERDRAFT_LIMIT = PostingStatus.OVERDRAFT_LIMIT
+
+_INVALID           = int(INVALID_AMOUNT)
+_INVALID_CURRENT   = (_INVALID, 'current')
+_OVERDRAFT_CURRENT = (int(OVERDRAFT_LIMIT), 'current')
+
+# Rejected postings by (status code, account_type). Both the raising
+# deposit()/withdraw() and the non-raising try_deposit()/try_withdraw() count.
+# A plain dict with int codes is markedly cheaper to bump than a Counter
+# keyed by enum members.
+_rejected = {}
+
+def count_rejection(status, account_type) -> None:
+    key = int(status), account_type
+    _rejected[key] = _rejected.get(key, 0) + 1
+
+def rejections() -> Counter:
+    """Rejected postings counted by (PostingStatus, account_type)."""
+    return Counter({(PostingStatus(code), account_type): count
+                    for (code, account_type), count in _rejected.items()})
+
+def reset_rejections() -> None:
+    _rejected.clear()
+
+class Account:
+
+    """A class to represent a bank account."""
+
+    # Slots keep the core state compact. Façades without __slots__ still get
+    # a __dict__ for their own attributes. transaction is only used by some
+    # façades, but it is declared here so that subclasses never end up with
+    # conflicting slot layouts.
+    __slots__ = ('account_number', 'account_holder', '_balance', 'account_type', 'transaction', 'subscribers')
+
+    instance_count = 0
+
+    @classmethod
+    def increment_instance_count(cls):
+        Account.instance_count += 1
+
+    @staticmethod
+    def static_function():
+        print('Static method')
+
+    TYPES = ('current', 'savings', 'deposit', 'investment')
+
+    # Callables invoked as observer(account, signed_minor_units) after every
+    # successful posting on any account of the class. A single account takes
+    # the same callables through subscribe(); they are kept apart from the
+    # class observers, which therefore stay visible to every account.
+    observers = ()
+
+    # Callables invoked as opener(account) once the core state of a new
+    # account is set. Subclasses set their own fields before calling
+    # Account.__init__, so openers see a complete account.
+    openers = ()
+
+    # An AccountNumberRegistry; when set, construction claims the account
+    # number and rejects duplicates.
+    numbers = None
+
+    def __init__(self,
+                account_number,
+                account_holder,
+                opening_balance,
+                account_type) -> None:
+
+        validate_account_number(account_number)
+        validate_account_holder(account_holder)
+
+        if opening_balance < 0:
+            raise ValueError(f"Opening balance must be positive!")
+
+        if account_type not in self.TYPES:
+            raise ValueError(f"Invalid account type. Account must be one of the following: {self.TYPES}")
+
+        balance = to_minor(opening_balance)
+        if self.numbers is not None:
+            self.numbers.claim(account_number)
+        self.increment_instance_count()
+        self.account_number   = account_number
+        self.account_holder   = account_holder
+        self._balance         = balance
+        self.account_type     = account_type
+        self.subscribers      = ()
+        for opener in self.openers:
+            opener(self)
+
+    @property
+    def _opening_balance(self):
+        return to_major(self._balance)
+
+    @_opening_balance.setter
+    def _opening_balance(self, value):
+        self._set_balance(to_minor(value))
+
+    def _set_balance(self, units) -> None:
+        delta = units - self._balance
+        self._balance = units
+        if delta and (self.observers or self.subscribers):
+            self._notify(delta)
+
+    @property
+    def minor_balance(self) -> int:
+        return self._balance
+
+    def __str__(self) -> str:
+        return f"Account[{self.account_number}] - {self.account_holder}, {self.account_type} account = {self._opening_balance}"
+
+    def __repr__(self) -> str:
+        return f"Account('{self.account_number}', '{self.account_holder}', {self._opening_balance}, '{self.account_type}')"
+
+    def subscribe(self, subscriber) -> None:
+        """Call subscriber(account, signed_minor_units) after every posting on this account."""
+        self.subscribers = self.subscribers + (subscriber,)
+
+    def unsubscribe(self, subscriber) -> None:
+        self.subscribers = tuple(callback for callback in self.subscribers if callback != subscriber)
+
+    def _notify(self, amount) -> None:
+        for observer in self.observers:
+            observer(self, amount)
+        for subscriber in self.subscribers:
+            subscriber(self, amount)
+
+    def deposit(self, amount: int) -> None:
+        units = posting_units(amount)
+        if units > 0:
+            self._balance += units
+            if self.observers or self.subscribers:
+                self._notify(units)
+        else:
+            key = _INVALID, self.account_type
+            _rejected[key] = _rejected.get(key, 0) + 1
+            raise AmountError(self, "Cannot deposit negative amounts")
+
+    def withdraw(self, amount: int) -> None:
+        units = posting_units(amount)
+        if units > 0:
+            self._balance -= units
+            if self.observers or self.subscribers:
+                self._notify(-units)
+        else:
+            key = _INVALID, self.account_type
+            _rejected[key] = _rejected.get(key, 0) + 1
+            raise AmountError(self, "Cannot withdraw negative amounts")
+
+    def try_deposit(self, amount: int) -> PostingStatus:
+        """Like deposit(), but a rejection is returned as a PostingStatus instead of raised."""
+        units = posting_units(amount)
+        if units <= 0:
+            key = _INVALID, self.account_type
+            _rejected[key] = _rejected.get(key, 0) + 1
+            return INVALID_AMOUNT
+        self._balance += units
+        if self.observers or self.subscribers:
+            self._notify(units)
+        return POSTED
+
+    def try_withdraw(self, amount: int) -> PostingStatus:
+        """Like withdraw(), but a rejection is returned as a PostingStatus instead of raised."""
+        units = posting_units(amount)
+        if units <= 0:
+            key = _INVALID, self.account_type
+            _rejected[key] = _rejected.get(key, 0) + 1
+            return INVALID_AMOUNT
+        self._balance -= units
+        if self.observers or self.subscribers:
+            self._notify(-units)
+        return POSTED
+
+    @property
+    def get_balance(self):
+        return to_major(self._balance)
+
+    @get_balance.setter
+    def get_balance(self, value):
+        if isinstance(value, int) & (value > 0):
+            self._set_balance(to_minor(value))
+
+class CurrentAccount(Account):
+
+    """A subclass to represent a current account"""
+
+    __slots__ = ('overdraft_limit', '_limit')
+
+    def __init__(self, account_number, account_holder, opening_balance, overdraft_limit) -> None:
+        self.overdraft_limit = overdraft_limit
+        self._limit          = to_minor(overdraft_limit)
+        super().__init__(account_number, account_holder, opening_balance, 'current')
+
+    def __str__(self) -> str:
+        return f"CurrentAccount[{self.account_number}] - {self.account_holder}, account = {self._opening_balance}, overdraft limit = {self.overdraft_limit}"
+
+    def __repr__(self) -> str:
+        return f"CurrentAccount('{self.account_number}', '{self.account_holder}', {self._opening_balance}, {self.overdraft_limit})"
+
+    def withdraw(self, amount: int) -> None:
+        units = posting_units(amount)
+        if units <= 0:
+            _rejected[_INVALID_CURRENT] = _rejected.get(_INVALID_CURRENT, 0) + 1
+            raise AmountError(self, "Cannot withdraw negative amounts")
+        if self._balance - units < self._limit:
+            _rejected[_OVERDRAFT_CURRENT] = _rejected.get(_OVERDRAFT_CURRENT, 0) + 1
+            raise BalanceError(self, "Cannot excced your overdraft limit!")
+        self._balance -= units
+        if self.observers or self.subscribers:
+            self._notify(-units)
+
+    def try_withdraw(self, amount: int) -> PostingStatus:
+        units = posting_units(amount)
+        if units <= 0:
+            _rejected[_INVALID_CURRENT] = _rejected.get(_INVALID_CURRENT, 0) + 1
+            return INVALID_AMOUNT
+        if self._balance - units < self._limit:
+            _rejected[_OVERDRAFT_CURRENT] = _rejected.get(_OVERDRAFT_CURRENT, 0) + 1
+            return OVERDRAFT_LIMIT
+        self._balance -= units
+        if self.observers or self.subscribers:
+            self._notify(-units)
+        return POSTED
+
+class DepositAccount(Account):
+
+    """A subclass to represent a deposit account"""
+
+    __slots__ = ('interest_rate',)
+
+    def __init__(self, account_number, account_holder, opening_balance, interest_rate) -> None:
+        self.interest_rate = interest_rate
+        super().__init__(account_number, account_holder, opening_balance, 'deposit')
+
+    def __str__(self) -> str:
+        return f"DepositAccount[{self.account_number}] - {self.account_holder}, account = {self._opening_balance}, interest rate = {self.interest_rate}"
+
+    def __repr__(self) -> str:
+        return f"DepositAccount('{self.account_number}', '{self.account_holder}', {self._opening_balance}, {self.interest_rate})"
+
+    def interest(self):
+        return self._opening_balance * self.interest_rate
+
+class InvestmentAccount(Account):
+
+    """A subclass to represent an investment account"""
+
+    __slots__ = ('risk_level',)
+
+    RISK_TYPES = ('low', 'medium', 'high')
+
+    def __init__(self, account_number, account_holder, opening_balance, risk_level) -> None:
+        if risk_level not in self.RISK_TYPES:
+            raise ValueError(f"Invalid risk type. Account must be one of the following: {self.RISK_TYPES}")
+
+        self.risk_level = risk_level
+        super().__init__(account_number, account_holder, opening_balance, 'investment')
+
+    def __str__(self) -> str:
+        return f"InvestmentAccount[{self.account_number}] - {self.account_holder}, account = {self._opening_balance}, risk level = {self.risk_level}"
+
+    def __repr__(self) -> str:
+        return f"InvestmentAccount('{self.account_number}', '{self.account_holder}', {self._opening_balance}, {self.risk_level})"
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# Timestamped posting history for one account. Amounts are kept in a
+# Fenwick (binary indexed) tree over posting order, so the balance at any
+# time and the net movement between two times are O(log n). Appending a
+# posting, or correcting an earlier one, is also O(log n).
+#
+
+from array import array
+from bisect import bisect_left, bisect_right
+from time import time_ns
+
+from bank_account.money import to_major
+
+class BalanceHistory:
+
+    """Postings in signed minor units, ordered by timestamp (ns since the epoch).
+
+    Attach it to an account and every posting is recorded through the
+    account's subscribers.
+    """
+
+    def __init__(self, opening_balance=0, clock=time_ns) -> None:
+        self.opening_balance = opening_balance
+        self.clock           = clock
+        self.times           = array('q')
+        self._tree           = array('q', [0])
+
+    @classmethod
+    def attach(cls, account, clock=time_ns):
+        """A history starting from the account's current balance, fed by its postings."""
+        history = cls(account.minor_balance, clock)
+        account.subscribe(history.record)
+        return history
+
+    def detach(self, account) -> None:
+        account.unsubscribe(self.record)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def record(self, account, amount) -> None:
+        """Observer callback for Account.observers; amount is in signed minor units."""
+        # The posting has already been applied, so a wall clock that stepped
+        # back must not fail it; the posting takes the last recorded time.
+        timestamp = self.clock()
+        if self.times and timestamp < self.times[-1]:
+            timestamp = self.times[-1]
+        self.append(amount, timestamp)
+
+    def append(self, amount, timestamp=None) -> None:
+        timestamp = self.clock() if timestamp is None else timestamp
+        if self.times and timestamp < self.times[-1]:
+            raise ValueError(f"Posting at {timestamp} is earlier than the last posting at {self.times[-1]}.")
+        self.times.append(timestamp)
+        # The new node covers positions (index - lowbit(index), index]; all but
+        # the new amount are already summed in the existing tree.
+        index = len(self.times)
+        lower = index - (index & -index)
+        self._tree.append(amount + self._prefix(index - 1) - self._prefix(lower))
+
+    def correct(self, position, amount) -> None:
+        """Add a signed minor-unit adjustment to the posting at position (0-based)."""
+        if not 0 <= position < len(self.times):
+            raise IndexError(f"No posting at position {position}.")
+        index, tree = position + 1, self._tree
+        while index < len(tree):
+            tree[index] += amount
+            index += index & -index
+
+    def minor_balance_at(self, timestamp) -> int:
+        """Balance in minor units after every posting made at or before timestamp."""
+        return self.opening_balance + self._prefix(bisect_right(self.times, timestamp))
+
+    def balance_at(self, timestamp):
+        return to_major(self.minor_balance_at(timestamp))
+
+    def sum_between(self, start, end):
+        """Net movement in major units of the postings made from start to end inclusive."""
+        times = self.times
+        return to_major(self._prefix(bisect_right(times, end)) - self._prefix(bisect_left(times, start)))
+
+    def _prefix(self, count) -> int:
+        """Sum of the first count postings."""
+        tree, total = self._tree, 0
+        while count:
+            total += tree[count]
+            count &= count - 1
+        return total
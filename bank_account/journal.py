@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import mmap
+import os
+import struct
+from array import array
+from time import time_ns
+
+# account number, posting kind, amount in minor units, timestamp in ns since the epoch
+RECORD = struct.Struct('<IB3xqq')
+
+DEPOSIT    = 1
+WITHDRAWAL = 2
+
+class Journal:
+
+    """An append-only file of fixed-width posting records with group commit.
+
+    Records are buffered and written with a single fsync once group_size of
+    them are pending, on commit() or when the journal is closed.
+    """
+
+    def __init__(self, path, group_size=512) -> None:
+        self.path       = path
+        self.group_size = group_size
+        self._file      = open(path, 'ab')
+        self._buffer    = bytearray()
+        self._pending   = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def append(self, account_number, kind, amount, timestamp=None) -> None:
+        self._buffer += RECORD.pack(int(account_number), kind, amount,
+                                    time_ns() if timestamp is None else timestamp)
+        self._pending += 1
+        if self._pending >= self.group_size:
+            self.commit()
+
+    def record(self, account, amount) -> None:
+        """Observer callback for Account.observers; amount is in signed minor units."""
+        if amount > 0:
+            self.append(account.account_number, DEPOSIT, amount)
+        else:
+            self.append(account.account_number, WITHDRAWAL, -amount)
+
+    def attach(self, target) -> None:
+        """Journal every posting on an account class, a single account or an AccountBook."""
+        if _is_account(target):
+            target.subscribe(self.record)
+        else:
+            target.observers = target.observers + (self.record,)
+
+    def detach(self, target) -> None:
+        if _is_account(target):
+            target.unsubscribe(self.record)
+        else:
+            target.observers = tuple(observer for observer in target.observers if observer != self.record)
+
+    def commit(self) -> None:
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._buffer.clear()
+            self._pending = 0
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.commit()
+            self._file.close()
+
+def replay(path) -> dict:
+    """Net movement in minor units per account number, from one scan of the mapped file.
+
+    A torn record left at the end of the file by a crash is ignored.
+    """
+    size = os.path.getsize(path)
+    end  = size - size % RECORD.size
+    if not end:
+        return {}
+
+    totals  = array('q', bytes(8 * 1_000_000))
+    touched = bytearray(1_000_000)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            for number, kind, amount, _ in RECORD.iter_unpack(view[:end]):
+                totals[number] += amount if kind == DEPOSIT else -amount
+                touched[number] = 1
+    return {f"{number:06d}": totals[number] for number in _positions(touched)}
+
+def replay_into(path, book) -> None:
+    """Apply the journal's net movements on top of an AccountBook's balances."""
+    for account_number, amount in replay(path).items():
+        row = book.row(account_number)
+        book.balances[row] += amount
+        book.touch(row)
+
+def _is_account(target) -> bool:
+    # Classes and books take observers for all their accounts; a single
+    # account or view takes subscribers of its own.
+    return not isinstance(target, type) and hasattr(target, 'subscribe')
+
+def _positions(flags):
+    position = flags.find(1)
+    while position != -1:
+        yield position
+        position = flags.find(1, position + 1)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# Balances are held as plain ints counting minor units (pence), so posting
+# is ordinary int arithmetic and stays exact. Plain int amounts keep their
+# historical meaning of whole major units; fractional amounts are passed as
+# Money, an int subclass that is already in minor units.
+#
+
+MINOR_UNITS = 100
+
+class Money(int):
+
+    """An exact amount of money held as an integer number of minor units."""
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, value):
+        """Money from a major-unit value such as 10, 10.05, '10.05' or Decimal('10.05')."""
+        return cls(to_minor(value))
+
+    @property
+    def major(self):
+        """The amount in major units as a Decimal."""
+        from decimal import Decimal
+        return Decimal(int(self)) / MINOR_UNITS
+
+    def __str__(self) -> str:
+        sign = '-' if self < 0 else ''
+        whole, part = divmod(abs(int(self)), MINOR_UNITS)
+        return f"{sign}{whole}.{part:02d}"
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+    # Arithmetic stays in minor units and returns Money, so results are
+    # never mistaken for major-unit ints by posting_units(). Plain ints are
+    # major units to posting_units(), so adding one to Money is ambiguous and
+    # raises TypeError; only 0, which sum() starts from, is accepted. Money
+    # can only be scaled by ints.
+    def __add__(self, other):
+        if isinstance(other, int):
+            return Money(int(self) + _addend(other))
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, int):
+            return Money(int(self) - _addend(other))
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, int):
+            return Money(_addend(other) - int(self))
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, int) and not isinstance(other, Money):
+            return Money(int(self) * int(other))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        if isinstance(other, int) and not isinstance(other, Money):
+            return Money(int(self) // int(other))
+        return NotImplemented
+
+    def __neg__(self):
+        return Money(-int(self))
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Money(abs(int(self)))
+
+def _addend(other) -> int:
+    if isinstance(other, Money) or other == 0:
+        return int(other)
+    raise TypeError(f"Cannot add {other!r} to Money. Use Money.of({other!r}) for major units or Money({other!r}) for minor units.")
+
+def to_minor(value) -> int:
+    """Exact minor units for a major-unit value; rejects sub-minor-unit precision."""
+    if type(value) is int:
+        return value * MINOR_UNITS
+    if isinstance(value, Money):
+        return int(value)
+    if isinstance(value, int):
+        return int(value) * MINOR_UNITS
+
+    # decimal is only needed off the int fast path, so it is imported lazily.
+    from decimal import Decimal, InvalidOperation
+    try:
+        # repr() gives the shortest string that round-trips, so 10.05 stays 10.05.
+        exact = Decimal(repr(value) if isinstance(value, float) else value) * MINOR_UNITS
+    except (InvalidOperation, TypeError):
+        raise ValueError(f"Invalid amount {value!r}. Amount must be a number.") from None
+    if not exact.is_finite() or exact != exact.to_integral_value():
+        raise ValueError(f"Invalid amount {value!r}. Amount must be a whole number of minor units.")
+    return int(exact)
+
+def to_major(minor):
+    """Major-unit value for display: an int when whole, otherwise a float."""
+    whole, part = divmod(minor, MINOR_UNITS)
+    return whole if not part else minor / MINOR_UNITS
+
+def posting_units(amount) -> int:
+    """Signed minor units of a posting amount, or 0 when it is not an int or Money."""
+    if type(amount) is int:
+        return amount * MINOR_UNITS
+    if isinstance(amount, Money):
+        return int(amount)
+    if isinstance(amount, int):
+        return int(amount) * MINOR_UNITS
+    return 0
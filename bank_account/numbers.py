@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# Account numbers are six digit strings, so the whole number space fits in
+# a 1M-entry bytearray with one byte per number. Claims, releases and lookups
+# are single index operations, and free numbers are found with
+# bytearray.find, which scans in C.
+#
+# Enforcement is opt in: set Account.numbers (on core.Account for every
+# façade, or on one façade class) to a registry and construction claims the
+# number, raising ValueError on a duplicate.
+#
+
+from bank_account.validation import validate_account_number
+
+class AccountNumberRegistry:
+
+    """The set of account numbers in use, held as a dense 1M-entry bytearray."""
+
+    CAPACITY = 1_000_000
+
+    def __init__(self, numbers=()) -> None:
+        self._used   = bytearray(self.CAPACITY)
+        self._count  = 0
+        self._cursor = 0
+        for account_number in numbers:
+            self.claim(account_number)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, account_number) -> bool:
+        index = int(account_number)
+        return 0 <= index < self.CAPACITY and self._used[index] == 1
+
+    @property
+    def free(self) -> int:
+        return self.CAPACITY - self._count
+
+    @property
+    def occupancy(self) -> float:
+        """Fraction of the number space in use."""
+        return self._count / self.CAPACITY
+
+    def claim(self, account_number) -> None:
+        validate_account_number(account_number)
+        index = int(account_number)
+        if self._used[index]:
+            raise ValueError(f"Account number {account_number} is already in use.")
+        self._used[index] = 1
+        self._count += 1
+
+    def release(self, account_number) -> None:
+        index = int(account_number)
+        if not (0 <= index < self.CAPACITY and self._used[index]):
+            raise ValueError(f"Account number {account_number} is not in use.")
+        self._used[index] = 0
+        self._count -= 1
+        if index < self._cursor:
+            self._cursor = index
+
+    def collisions(self, numbers) -> list:
+        """Numbers that are already in use or repeated within numbers, without claiming any."""
+        seen, found = bytearray(self._used), []
+        for account_number in numbers:
+            index = int(account_number)
+            if seen[index]:
+                found.append(account_number)
+            seen[index] = 1
+        return found
+
+    def allocate(self, n=1) -> list:
+        """Claim and return the n lowest free account numbers."""
+        if n > self.free:
+            raise ValueError(f"Cannot allocate {n} account numbers, only {self.free} are free.")
+        used, find = self._used, self._used.find
+        numbers, index = [], self._cursor
+        for _ in range(n):
+            index = find(0, index)
+            used[index] = 1
+            numbers.append(f"{index:06d}")
+            index += 1
+        self._count += n
+        self._cursor = index
+        return numbers
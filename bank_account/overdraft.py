@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+from bank_account.money import to_major, to_minor
+from bank_account.registry import SortedIndex
+
+class OverdraftScanner:
+
+    """Current accounts ordered by headroom, the balance left above the overdraft limit.
+
+    Postings re-rank accounts through the observer hooks, so the accounts
+    closest to (or past) their limit can be read at any time.
+    """
+
+    def __init__(self, accounts=()) -> None:
+        self._headroom = SortedIndex()
+        for account in accounts:
+            self.add(account)
+
+    def __len__(self) -> int:
+        return len(self._headroom)
+
+    def __contains__(self, account) -> bool:
+        return account in self._headroom._order
+
+    def attach(self, target) -> None:
+        """Scan every current account created from an account class from now on."""
+        target.openers = target.openers + (self._include,)
+        target.observers = target.observers + (self._posted,)
+
+    def detach(self, target) -> None:
+        target.openers = tuple(opener for opener in target.openers if opener != self._include)
+        target.observers = tuple(observer for observer in target.observers if observer != self._posted)
+
+    def add(self, account) -> None:
+        if account.account_type != 'current':
+            raise ValueError(f"Account {account.account_number} is not a current account.")
+        if account in self:
+            raise ValueError(f"Account {account.account_number} is already being scanned.")
+        self._include(account)
+        account.subscribe(self._posted)
+
+    def remove(self, account) -> None:
+        self._headroom.remove(account)
+        account.unsubscribe(self._posted)
+
+    def headroom(self, account):
+        """Headroom in major units."""
+        return to_major(self._headroom.key(account))
+
+    def top_k(self, k) -> list:
+        """The k accounts with the least headroom, closest to their limit first."""
+        return self._headroom.first(k)
+
+    def below(self, threshold) -> list:
+        """Accounts whose headroom is at most threshold (major units), least headroom first."""
+        return self._headroom.between(high=to_minor(threshold))
+
+    def _include(self, account) -> None:
+        if account.account_type == 'current':
+            self._headroom.insert(account.minor_balance - account._limit, account)
+
+    def _posted(self, account, amount) -> None:
+        if account in self:
+            self._headroom.update(account.minor_balance - account._limit, account)
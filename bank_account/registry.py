@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+from bisect import bisect_left, bisect_right
+from itertools import count
+
+from bank_account.money import to_minor
+
+class SortedIndex:
+
+    """Items kept ordered by a numeric key, with range queries by bisection.
+
+    Ties are broken by insertion order, so each (key, item) pair is unique.
+    """
+
+    def __init__(self) -> None:
+        self._keys  = []
+        self._items = []
+        self._order = {}
+        self._next  = count()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, key, item) -> None:
+        entry = self._order[item] = (key, next(self._next))
+        position = bisect_left(self._keys, entry)
+        self._keys.insert(position, entry)
+        self._items.insert(position, item)
+
+    def remove(self, item) -> None:
+        position = bisect_left(self._keys, self._order.pop(item))
+        del self._keys[position]
+        del self._items[position]
+
+    def update(self, key, item) -> None:
+        self.remove(item)
+        self.insert(key, item)
+
+    def key(self, item):
+        return self._order[item][0]
+
+    def between(self, low=None, high=None) -> list:
+        """Items with low <= key <= high; either bound may be omitted."""
+        start = 0 if low is None else bisect_left(self._keys, (low,))
+        stop  = len(self._keys) if high is None else bisect_right(self._keys, (high, float('inf')))
+        return self._items[start:stop]
+
+    def first(self, n) -> list:
+        return self._items[:n]
+
+class AccountRegistry:
+
+    """Accounts indexed by holder, account type, risk level and balance.
+
+    Registered accounts report every posting to the registry through
+    subscribe(), so the balance index stays current without rescans.
+    """
+
+    def __init__(self, accounts=()) -> None:
+        self._by_holder = {}
+        self._by_type   = {}
+        self._by_risk   = {}
+        self._balances  = SortedIndex()
+        for account in accounts:
+            self.add(account)
+
+    def __len__(self) -> int:
+        return len(self._balances)
+
+    def __contains__(self, account) -> bool:
+        return account in self._balances._order
+
+    def add(self, account) -> None:
+        if account in self:
+            raise ValueError(f"Account {account.account_number} is already registered.")
+        self._by_holder.setdefault(account.account_holder, set()).add(account)
+        self._by_type.setdefault(account.account_type, set()).add(account)
+        if account.account_type == 'investment':
+            self._by_risk.setdefault(account.risk_level, set()).add(account)
+        self._balances.insert(account.minor_balance, account)
+        account.subscribe(self._posted)
+
+    def remove(self, account) -> None:
+        self._by_holder[account.account_holder].discard(account)
+        self._by_type[account.account_type].discard(account)
+        if account.account_type == 'investment':
+            self._by_risk[account.risk_level].discard(account)
+        self._balances.remove(account)
+        account.unsubscribe(self._posted)
+
+    def by_holder(self, account_holder) -> set:
+        return set(self._by_holder.get(account_holder, ()))
+
+    def by_type(self, account_type) -> set:
+        return set(self._by_type.get(account_type, ()))
+
+    def by_risk(self, risk_level) -> set:
+        return set(self._by_risk.get(risk_level, ()))
+
+    def balance_between(self, low=None, high=None) -> list:
+        """Accounts with low <= balance <= high (major units), in balance order."""
+        return self._balances.between(None if low is None else to_minor(low),
+                                      None if high is None else to_minor(high))
+
+    def find(self, account_holder=None, account_type=None, risk_level=None) -> set:
+        """Accounts matching every given criterion, intersecting the smallest index first."""
+        candidates = []
+        if account_holder is not None:
+            candidates.append(self._by_holder.get(account_holder, set()))
+        if account_type is not None:
+            candidates.append(self._by_type.get(account_type, set()))
+        if risk_level is not None:
+            candidates.append(self._by_risk.get(risk_level, set()))
+        if not candidates:
+            return set(self._balances._order)
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
+
+    def _posted(self, account, amount) -> None:
+        self._balances.update(account.minor_balance, account)
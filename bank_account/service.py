@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+#
+# Usage: python -m bank_account.service [--port PORT] [--accounts N]
+#
+# Asyncio front-end for an AccountBook. Requests arriving within a short
+# window are coalesced into one AccountBook.post_batch call. The module
+# also runs a JSON-lines TCP server for load testing.
+#
+
+import argparse
+import asyncio
+import json
+
+from bank_account.account import AmountError, BalanceError, PostingStatus
+from bank_account.book import AccountBook
+from bank_account.money import posting_units
+
+class AccountService:
+
+    """Async facade over an AccountBook with request coalescing and back-pressure."""
+
+    def __init__(self, book, window=0.001, max_batch=4096, max_pending=65536) -> None:
+        self.book      = book
+        self.window    = window
+        self.max_batch = max_batch
+        self.batches   = 0
+        self._slots    = asyncio.Semaphore(max_pending)
+        self._pending  = []
+        self._handle   = None
+
+    async def deposit(self, account_number, amount) -> None:
+        self._check(account_number, amount, "Cannot deposit negative amounts")
+        await self._submit(account_number, posting_units(amount))
+
+    async def withdraw(self, account_number, amount) -> None:
+        self._check(account_number, amount, "Cannot withdraw negative amounts")
+        await self._submit(account_number, -posting_units(amount))
+
+    async def get_balance(self, account_number):
+        """Balance after every posting submitted before this call."""
+        self._check(account_number, 1, None)
+        return await self._submit(account_number, None)
+
+    async def _submit(self, account_number, amount):
+        async with self._slots:
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((account_number, amount, future))
+            if len(self._pending) >= self.max_batch:
+                self.flush()
+            elif self._handle is None:
+                self._handle = asyncio.get_running_loop().call_later(self.window, self.flush)
+            return await future
+
+    def flush(self) -> None:
+        """Apply everything queued so far, in arrival order."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        # Requests cancelled while queued are dropped, not posted.
+        pending, self._pending = [entry for entry in self._pending if not entry[2].done()], []
+        if pending:
+            self.batches += 1
+
+        # flush() usually runs as a call_later callback, where an exception
+        # would only be logged. Every waiting request gets it instead, which
+        # also releases their back-pressure slots.
+        try:
+            start = 0
+            for index, (account_number, amount, future) in enumerate(pending):
+                if amount is None:
+                    self._post(pending[start:index])
+                    start = index + 1
+                    if not future.done():
+                        future.set_result(self.book[account_number].get_balance)
+            self._post(pending[start:])
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _post(self, run) -> None:
+        if not run:
+            return
+        status = self.book.post_batch([number for number, _, _ in run], [units for _, units, _ in run], minor=True)
+        for (account_number, _, future), code in zip(run, status):
+            if future.done():
+                continue
+            if code == PostingStatus.POSTED:
+                future.set_result(None)
+            elif code == PostingStatus.OVERDRAFT_LIMIT:
+                future.set_exception(BalanceError(self.book[account_number], "Cannot excced your overdraft limit!"))
+            else:
+                future.set_exception(AmountError(self.book[account_number], "Cannot post invalid amounts"))
+
+    def _check(self, account_number, amount, msg) -> None:
+        # Rejected up front so one bad request cannot fail a whole batch: a
+        # known account and a positive int leave post_batch nothing to raise
+        # on, and every other outcome is a per-row status code.
+        try:
+            known = account_number in self.book
+        except (TypeError, ValueError, IndexError):
+            known = False
+        if not known:
+            raise KeyError(account_number)
+        if not (isinstance(amount, int) and amount > 0):
+            raise AmountError(self.book[account_number], msg)
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        """Start a JSON-lines TCP server, one request object per line.
+
+        {"op": "deposit" | "withdraw", "account": "123456", "amount": 10}
+        {"op": "balance", "account": "123456"}
+        """
+        return await asyncio.start_server(self._connection, host, port)
+
+    async def _connection(self, reader, writer) -> None:
+        # Requests on one connection are pipelined; responses keep their order.
+        # The bounded queue stops reading when the client runs too far ahead.
+        responses = asyncio.Queue(maxsize=1024)
+
+        async def respond():
+            while (task := await responses.get()) is not None:
+                writer.write(json.dumps(await task).encode() + b'\n')
+                await writer.drain()
+
+        responder = asyncio.create_task(respond())
+        try:
+            async for line in reader:
+                if line.strip():
+                    await responses.put(asyncio.create_task(self._dispatch(line)))
+        finally:
+            await responses.put(None)
+            await responder
+            writer.close()
+
+    async def _dispatch(self, line) -> dict:
+        try:
+            request = json.loads(line)
+            op      = request.get('op')
+            account = request.get('account')
+            if op == 'balance':
+                return {'ok': True, 'balance': await self.get_balance(account)}
+            if op == 'deposit':
+                await self.deposit(account, request.get('amount'))
+            elif op == 'withdraw':
+                await self.withdraw(account, request.get('amount'))
+            else:
+                return {'ok': False, 'error': f"Unknown op {op!r}"}
+            return {'ok': True}
+        except (AmountError, BalanceError) as e:
+            return {'ok': False, 'error': type(e).__name__}
+        except KeyError as e:
+            return {'ok': False, 'error': f"Unknown account {e.args[0]!r}"}
+        except (ValueError, AttributeError) as e:
+            return {'ok': False, 'error': f"Malformed request: {e}"}
+
+async def _main(port, accounts) -> None:
+    book = AccountBook()
+    for number in range(accounts):
+        book.open(f"{number:06d}", 'load test', 1000, 'current', overdraft_limit=-1000)
+    server = await AccountService(book).serve(port=port)
+    print(f"Serving {accounts} accounts on port {port}")
+    async with server:
+        await server.serve_forever()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='JSON-lines account service for load testing.')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--accounts', type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(_main(args.port, args.accounts))
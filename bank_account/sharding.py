@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import multiprocessing
+import os
+from array import array
+from collections import Counter
+from multiprocessing import shared_memory
+
+from bank_account.account import AmountError, BalanceError, PostingStatus, set_timer_mode
+from bank_account.money import Money, posting_units, to_major
+
+ACCOUNT_NUMBERS = 1_000_000
+
+# Range of the int64 amount column in the shared buffers, in minor units.
+MINOR_MIN = -2**63
+MINOR_MAX = 2**63 - 1
+
+class ShardedLedger:
+
+    """Accounts partitioned by account number across worker processes.
+
+    Each worker owns the account objects of its shard. Postings are routed
+    through one shared memory buffer per shard (account numbers, amounts in
+    minor units and the returned status codes), so only a row count crosses
+    the pipe.
+    """
+
+    def __init__(self, shards=None, capacity=65536, context=None) -> None:
+        self.shards   = shards or os.cpu_count() or 1
+        self.capacity = capacity + capacity % 2
+        context       = context or multiprocessing.get_context()
+        self._buffers = []
+        self._pipes   = []
+        self._workers = []
+        for _ in range(self.shards):
+            buffer = shared_memory.SharedMemory(create=True, size=13 * self.capacity)
+            parent, child = context.Pipe()
+            worker = context.Process(target=_serve_shard, args=(child, buffer.name, self.capacity), daemon=True)
+            worker.start()
+            child.close()
+            self._buffers.append(buffer)
+            self._pipes.append(parent)
+            self._workers.append(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def shard(self, account_number) -> int:
+        return int(account_number) % self.shards
+
+    def open(self, account) -> None:
+        """Hand an account object over to the worker owning its number."""
+        self._call(self.shard(account.account_number), ('open', account))
+
+    def get_balance(self, account_number):
+        return self._call(self.shard(account_number), ('balance', int(account_number)))
+
+    def post_batch(self, account_numbers, amounts):
+        """Apply signed amounts across shards; returns PostingStatus codes per row."""
+        if len(account_numbers) != len(amounts):
+            raise ValueError(f"Batch columns must be of equal length.")
+
+        # Rows are checked and converted up front, so nothing can fail once
+        # work has been sent to a shard.
+        status = array('b', bytes(len(amounts)))
+        routed = [array('l') for _ in range(self.shards)]
+        units  = array('q', bytes(8 * len(amounts)))
+        for position, (number, amount) in enumerate(zip(account_numbers, amounts)):
+            number = int(number)
+            amount = posting_units(amount)
+            if not 0 <= number < ACCOUNT_NUMBERS:
+                status[position] = PostingStatus.UNKNOWN_ACCOUNT
+            elif not MINOR_MIN <= amount <= MINOR_MAX:
+                status[position] = PostingStatus.INVALID_AMOUNT
+            else:
+                units[position] = amount
+                routed[number % self.shards].append(position)
+
+        for start in range(0, max(map(len, routed), default=0), self.capacity):
+            active = []
+            try:
+                for shard, positions in enumerate(routed):
+                    chunk = positions[start:start + self.capacity]
+                    if chunk:
+                        self._write(shard, [int(account_numbers[p]) for p in chunk], [units[p] for p in chunk])
+                        self._pipes[shard].send(('post', len(chunk)))
+                        active.append((shard, chunk))
+            finally:
+                # Every shard that was sent work must have its reply read,
+                # or later calls would read it instead of their own.
+                error = None
+                for shard, chunk in active:
+                    try:
+                        self._reply(shard)
+                    except Exception as e:
+                        error = error or e
+                        continue
+                    codes = self._buffers[shard].buf[12 * self.capacity:12 * self.capacity + len(chunk)]
+                    for position, code in zip(chunk, codes):
+                        status[position] = code
+                    codes.release()
+            if error is not None:
+                raise error
+        return status
+
+    def totals_by_type(self) -> dict:
+        """Total balance per account_type, gathered from every shard."""
+        for pipe in self._pipes:
+            pipe.send(('totals', None))
+        totals = Counter()
+        for shard in range(self.shards):
+            totals.update(self._reply(shard))
+        return {account_type: to_major(units) for account_type, units in totals.items()}
+
+    def count(self) -> int:
+        for pipe in self._pipes:
+            pipe.send(('count', None))
+        return sum(self._reply(shard) for shard in range(self.shards))
+
+    def close(self) -> None:
+        for pipe, worker in zip(self._pipes, self._workers):
+            if worker.is_alive():
+                pipe.send(('stop', None))
+            worker.join()
+            pipe.close()
+        for buffer in self._buffers:
+            buffer.close()
+            buffer.unlink()
+        self._workers = []
+        self._pipes   = []
+        self._buffers = []
+
+    def _write(self, shard, numbers, amounts) -> None:
+        buf = self._buffers[shard].buf
+        buf[:4 * len(numbers)] = array('i', numbers).tobytes()
+        buf[4 * self.capacity:4 * self.capacity + 8 * len(amounts)] = array('q', amounts).tobytes()
+
+    def _call(self, shard, message):
+        self._pipes[shard].send(message)
+        return self._reply(shard)
+
+    def _reply(self, shard):
+        ok, result = self._pipes[shard].recv()
+        if not ok:
+            raise result
+        return result
+
+def _serve_shard(pipe, buffer_name, capacity) -> None:
+    set_timer_mode('off')
+    buffer   = shared_memory.SharedMemory(name=buffer_name)
+    numbers  = buffer.buf[:4 * capacity].cast('i')
+    amounts  = buffer.buf[4 * capacity:12 * capacity].cast('q')
+    status   = buffer.buf[12 * capacity:13 * capacity]
+    accounts = {}
+    try:
+        while True:
+            op, argument = pipe.recv()
+            if op == 'stop':
+                break
+            try:
+                if op == 'post':
+                    _post(accounts, numbers, amounts, status, argument)
+                    result = None
+                elif op == 'open':
+                    number = int(argument.account_number)
+                    if number in accounts:
+                        raise ValueError(f"Account number {argument.account_number} is already in the ledger.")
+                    accounts[number] = argument
+                    result = None
+                elif op == 'balance':
+                    result = accounts[argument].get_balance
+                elif op == 'totals':
+                    result = Counter()
+                    for account in accounts.values():
+                        result[account.account_type] += account.minor_balance
+                elif op == 'count':
+                    result = len(accounts)
+                pipe.send((True, result))
+            except Exception as e:
+                pipe.send((False, e))
+    finally:
+        numbers.release()
+        amounts.release()
+        status.release()
+        buffer.close()
+
+def _post(accounts, numbers, amounts, status, count) -> None:
+    for i in range(count):
+        account = accounts.get(numbers[i])
+        amount  = amounts[i]
+        if account is None:
+            status[i] = PostingStatus.UNKNOWN_ACCOUNT
+            continue
+        try:
+            if amount > 0:
+                account.deposit(Money(amount))
+            elif amount < 0:
+                account.withdraw(Money(-amount))
+            else:
+                raise AmountError(account, "Cannot post zero amounts")
+            status[i] = PostingStatus.POSTED
+        except AmountError:
+            status[i] = PostingStatus.INVALID_AMOUNT
+        except BalanceError:
+            status[i] = PostingStatus.OVERDRAFT_LIMIT
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# __slots__ variants of the bank_account.account classes. Constructors and
+# behaviour match, but instances carry no __dict__, which saves memory per
+# account and speeds up attribute access. Reading a misspelt attribute
+# raises AttributeError naming the closest real attribute. Assigning one
+# raises a plain AttributeError instead of creating it; a __setattr__ hook
+# for the hint would slow down every balance update.
+# Observers can only be attached to the classes, not to single instances.
+#
+
+from difflib import get_close_matches
+
+from bank_account import core
+from bank_account.account import timer
+
+class Account(core.Account):
+
+    """A class to represent a bank account, without a per-instance dict."""
+
+    __slots__ = ()
+
+    instance_count = 0
+
+    @classmethod
+    def increment_instance_count(cls):
+        Account.instance_count += 1
+
+    def __init__(self,
+                account_number,
+                account_holder,
+                opening_balance,
+                account_type,
+                transaction=()) -> None:
+        super().__init__(account_number, account_holder, opening_balance, account_type)
+        self.transaction = transaction
+
+    def __getattr__(self, attribute):
+        # Only reached when normal lookup has already failed.
+        names = [name for name in dir(type(self)) if not name.startswith('__')]
+        if attribute in names:
+            raise AttributeError(f"'{type(self).__name__}' object attribute '{attribute}' is not set.")
+        close = get_close_matches(attribute, names, n=1)
+        hint  = f" Did you mean '{close[0]}'?" if close else ''
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attribute}'.{hint}")
+
+    def __iter__(self):
+        yield from self.transaction
+
+    deposit      = timer(core.Account.deposit)
+    withdraw     = timer(core.Account.withdraw)
+    try_deposit  = timer(core.Account.try_deposit)
+    try_withdraw = timer(core.Account.try_withdraw)
+
+class CurrentAccount(core.CurrentAccount, Account):
+
+    """A subclass to represent a current account"""
+
+    __slots__ = ()
+
+    def __init__(self, account_number, account_holder, opening_balance, overdraft_limit, transaction=()) -> None:
+        super().__init__(account_number, account_holder, opening_balance, overdraft_limit)
+        self.transaction = transaction
+
+    withdraw     = timer(core.CurrentAccount.withdraw)
+    try_withdraw = timer(core.CurrentAccount.try_withdraw)
+
+class DepositAccount(core.DepositAccount, Account):
+
+    """A subclass to represent a deposit account"""
+
+    __slots__ = ()
+
+    def __init__(self, account_number, account_holder, opening_balance, interest_rate, transaction=()) -> None:
+        super().__init__(account_number, account_holder, opening_balance, interest_rate)
+        self.transaction = transaction
+
+class InvestmentAccount(core.InvestmentAccount, Account):
+
+    """A subclass to represent an investment account"""
+
+    __slots__ = ()
+
+    def __init__(self, account_number, account_holder, opening_balance, risk_level, transaction=()) -> None:
+        super().__init__(account_number, account_holder, opening_balance, risk_level)
+        self.transaction = transaction
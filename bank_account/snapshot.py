@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import struct
+from array import array
+
+from bank_account.book import AccountBook
+
+# magic, segment kind, row count, holder bytes, book sequence at write time.
+# The columns follow, then the UTF-8 byte length of each holder as uint32
+# and the holders themselves, so a holder may contain any character.
+HEADER = struct.Struct('<4sBIIQ')
+MAGIC  = b'ABSN'
+
+BASE  = 0
+DELTA = 1
+
+# (AccountBook attribute, array typecode) in on-disk order
+COLUMNS = (('numbers', 'i'), ('balances', 'q'), ('limits', 'q'),
+           ('rates', 'd'), ('types', 'b'), ('risks', 'b'))
+
+class Checkpointer:
+
+    """Writes a base snapshot of an AccountBook followed by delta segments.
+
+    Each delta holds only the rows changed since the previous checkpoint,
+    so frequent checkpoints of a large, mostly idle book stay small.
+    """
+
+    def __init__(self, book, path) -> None:
+        self.book     = book
+        self.path     = path
+        self.sequence = None
+
+    def checkpoint(self) -> int:
+        """Write a delta if a base exists, otherwise a full snapshot."""
+        if self.sequence is None:
+            return self.snapshot()
+        rows = self.book.changed_since(self.sequence)
+        with open(self.path, 'ab') as f:
+            _write_segment(f, self.book, DELTA, rows)
+        self.sequence = self.book.sequence
+        return len(rows)
+
+    def snapshot(self) -> int:
+        """Rewrite the file as a single base segment."""
+        with open(self.path, 'wb') as f:
+            _write_segment(f, self.book, BASE, None)
+        self.sequence = self.book.sequence
+        return len(self.book)
+
+def load(path) -> AccountBook:
+    """Rebuild an AccountBook from a base segment and its deltas without re-validation."""
+    with open(path, 'rb') as f:
+        data = memoryview(f.read())
+
+    book   = AccountBook()
+    offset = 0
+    while offset < len(data):
+        magic, kind, count, holder_size, _ = HEADER.unpack_from(data, offset)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid snapshot. Segment at byte {offset} has no snapshot header.")
+        offset += HEADER.size
+
+        columns = {}
+        for name, typecode in COLUMNS:
+            column = array(typecode)
+            end    = offset + count * column.itemsize
+            column.frombytes(data[offset:end])
+            columns[name] = column
+            offset = end
+        lengths = array('I')
+        end     = offset + count * lengths.itemsize
+        lengths.frombytes(data[offset:end])
+        holders = []
+        for length in lengths:
+            holders.append(str(data[end:end + length], 'utf-8'))
+            end += length
+        offset += lengths.itemsize * count + holder_size
+
+        if kind == BASE:
+            _load_base(book, columns, holders)
+        else:
+            _apply_delta(book, columns, holders)
+    return book
+
+def _write_segment(f, book, kind, rows) -> None:
+    if rows is None:
+        columns = [getattr(book, name) for name, _ in COLUMNS]
+        holders = book.holders
+    else:
+        columns = [array(typecode, (getattr(book, name)[row] for row in rows)) for name, typecode in COLUMNS]
+        holders = [book.holders[row] for row in rows]
+    encoded = [holder.encode('utf-8') for holder in holders]
+    lengths = array('I', map(len, encoded))
+    f.write(HEADER.pack(MAGIC, kind, len(holders), sum(lengths), book.sequence))
+    for column in columns:
+        column.tofile(f)
+    lengths.tofile(f)
+    f.write(b''.join(encoded))
+
+def _load_base(book, columns, holders) -> None:
+    for name, _ in COLUMNS:
+        setattr(book, name, columns[name])
+    book.holders  = holders
+    book.versions = array('Q', bytes(8 * len(holders)))
+    rows = book._rows
+    for row, number in enumerate(book.numbers):
+        rows[number] = row
+
+def _apply_delta(book, columns, holders) -> None:
+    rows = book._rows
+    for index, number in enumerate(columns['numbers']):
+        row = rows[number]
+        if row == -1:
+            row = rows[number] = len(book.holders)
+            for name, _ in COLUMNS:
+                getattr(book, name).append(columns[name][index])
+            book.holders.append(holders[index])
+            book.versions.append(0)
+        else:
+            for name, _ in COLUMNS[1:]:
+                getattr(book, name)[row] = columns[name][index]
+            book.holders[row] = holders[index]
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# Streaming operators over transaction amounts. Each takes any iterable
+# (an Account, its transaction list, a generator reading a file) and yields
+# lazily, keeping at most one window of amounts in memory.
+#
+
+from collections import deque
+
+def running_balance(amounts, opening_balance=0):
+    balance = opening_balance
+    for amount in amounts:
+        balance += amount
+        yield balance
+
+def rolling_sum(amounts, window):
+    """Sum of the last window amounts, yielded for every amount."""
+    _check_window(window)
+    recent = deque()
+    total  = 0
+    for amount in amounts:
+        recent.append(amount)
+        total += amount
+        if len(recent) > window:
+            total -= recent.popleft()
+        yield total
+
+def rolling_min(amounts, window):
+    return _rolling_extreme(amounts, window, lambda kept, new: kept >= new)
+
+def rolling_max(amounts, window):
+    return _rolling_extreme(amounts, window, lambda kept, new: kept <= new)
+
+def credits(amounts):
+    return (amount for amount in amounts if amount > 0)
+
+def debits(amounts):
+    return (amount for amount in amounts if amount < 0)
+
+def between(amounts, minimum=None, maximum=None):
+    """Amounts whose absolute value lies within [minimum, maximum]."""
+    for amount in amounts:
+        size = abs(amount)
+        if (minimum is None or size >= minimum) and (maximum is None or size <= maximum):
+            yield amount
+
+def _rolling_extreme(amounts, window, dominated):
+    # Monotonic deque of (position, amount): amounts that can never be the
+    # extreme again are dropped, so each amount is pushed and popped once.
+    _check_window(window)
+    candidates = deque()
+    for position, amount in enumerate(amounts):
+        while candidates and dominated(candidates[-1][1], amount):
+            candidates.pop()
+        candidates.append((position, amount))
+        if candidates[0][0] <= position - window:
+            candidates.popleft()
+        yield candidates[0][1]
+
+def _check_window(window) -> None:
+    if not isinstance(window, int) or window < 1:
+        raise ValueError(f"Window must be a positive integer.")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+#     with UnitOfWork() as work:
+#         work.withdraw(source, 100)
+#         work.deposit(target, 100)
+#
+# Postings made through a unit of work are only buffered. On a clean exit
+# they are validated in a single pass, in the order they were made, with
+# the same rules as deposit()/withdraw(). They are applied only if every leg
+# passes. If the block raises, nothing is applied.
+#
+# Units of work read and restore the balance of account objects directly,
+# so they only take bank_account.core.Account instances and their façades.
+# Rows of an AccountBook are posted with AccountBook.post_batch instead.
+#
+
+from bank_account.core import Account, AmountError, BalanceError, PostingStatus, count_rejection
+from bank_account.money import posting_units, to_major
+
+DEPOSIT    = 1
+WITHDRAWAL = -1
+
+class UnitOfWork:
+
+    """Postings across any number of accounts, applied all or nothing."""
+
+    def __init__(self) -> None:
+        self._postings = []
+        self._net      = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def bind(self, account):
+        """A view of account whose postings go into this unit of work."""
+        return PendingAccount(self, account)
+
+    def deposit(self, account, amount) -> None:
+        self._buffer(account, posting_units(amount), DEPOSIT)
+
+    def withdraw(self, account, amount) -> None:
+        self._buffer(account, posting_units(amount), WITHDRAWAL)
+
+    def transfer(self, source, target, amount) -> None:
+        units = posting_units(amount)
+        self._buffer(source, units, WITHDRAWAL)
+        self._buffer(target, units, DEPOSIT)
+
+    def minor_balance(self, account) -> int:
+        """The account's balance in minor units as it would be after commit."""
+        return account.minor_balance + self._net.get(account, 0)
+
+    def commit(self) -> None:
+        """Validate every posting, then apply them all; on failure nothing changes."""
+        postings, self._postings, self._net = self._postings, [], {}
+        _check(postings)
+
+        # The undo log holds one starting balance per account, not copies of
+        # the accounts. If an observer fails, every observer that already saw
+        # a leg is sent the reverse delta, newest first and with the balance
+        # stepped back to match, so journals and indexes end where the
+        # balances do.
+        undo    = {}
+        applied = []
+        try:
+            for account, units, sign in postings:
+                units *= sign
+                if account not in undo:
+                    undo[account] = account._balance
+                account._balance += units
+                notified = []
+                applied.append((account, units, notified))
+                for observer in account.observers + account.subscribers:
+                    observer(account, units)
+                    notified.append(observer)
+        except BaseException:
+            try:
+                for account, units, notified in reversed(applied):
+                    account._balance -= units
+                    for observer in reversed(notified):
+                        observer(account, -units)
+            finally:
+                for account, balance in undo.items():
+                    account._balance = balance
+            raise
+
+    def rollback(self) -> None:
+        """Discard every buffered posting."""
+        self._postings.clear()
+        self._net.clear()
+
+    def _buffer(self, account, units, sign) -> None:
+        if not isinstance(account, Account):
+            raise TypeError(f"A unit of work takes account objects, not {type(account).__name__}.")
+        self._postings.append((account, units, sign))
+        if units > 0:
+            self._net[account] = self._net.get(account, 0) + sign * units
+
+def _check(postings) -> None:
+    """Raise the error deposit()/withdraw() would, for the first leg that fails."""
+    balances = {}
+    for account, units, sign in postings:
+        if units <= 0:
+            count_rejection(PostingStatus.INVALID_AMOUNT, account.account_type)
+            raise AmountError(account, f"Cannot {'deposit' if sign == DEPOSIT else 'withdraw'} negative amounts")
+        balance = balances.get(account, account._balance) + sign * units
+        if sign == WITHDRAWAL and account.account_type == 'current' and balance < account._limit:
+            count_rejection(PostingStatus.OVERDRAFT_LIMIT, 'current')
+            raise BalanceError(account, "Cannot excced your overdraft limit!")
+        balances[account] = balance
+
+class PendingAccount:
+
+    """An account as seen inside a unit of work.
+
+    deposit(), withdraw() and their try_ forms are buffered, get_balance
+    includes the buffered postings, and other attributes are read from the
+    account.
+    """
+
+    __slots__ = ('_work', '_account')
+
+    def __init__(self, work, account) -> None:
+        self._work    = work
+        self._account = account
+
+    def __getattr__(self, attribute):
+        return getattr(self._account, attribute)
+
+    def __repr__(self) -> str:
+        return f"PendingAccount({self._account!r})"
+
+    def deposit(self, amount: int) -> None:
+        self._work.deposit(self._account, amount)
+
+    def withdraw(self, amount: int) -> None:
+        self._work.withdraw(self._account, amount)
+
+    def try_deposit(self, amount: int) -> PostingStatus:
+        """Buffer a deposit, or return why it would be rejected; nothing is applied until commit."""
+        return self._try(posting_units(amount), DEPOSIT)
+
+    def try_withdraw(self, amount: int) -> PostingStatus:
+        return self._try(posting_units(amount), WITHDRAWAL)
+
+    def transfer(self, target, amount) -> None:
+        if isinstance(target, PendingAccount):
+            target = target._account
+        self._work.transfer(self._account, target, amount)
+
+    @property
+    def minor_balance(self) -> int:
+        return self._work.minor_balance(self._account)
+
+    def _try(self, units, sign) -> PostingStatus:
+        account = self._account
+        if units <= 0:
+            count_rejection(PostingStatus.INVALID_AMOUNT, account.account_type)
+            return PostingStatus.INVALID_AMOUNT
+        if (sign == WITHDRAWAL and account.account_type == 'current'
+                and self.minor_balance - units < account._limit):
+            count_rejection(PostingStatus.OVERDRAFT_LIMIT, 'current')
+            return PostingStatus.OVERDRAFT_LIMIT
+        self._work._buffer(account, units, sign)
+        return PostingStatus.POSTED
+
+    @property
+    def get_balance(self):
+        return to_major(self.minor_balance)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import re
+from functools import lru_cache
+
+TYPES = ('current', 'savings', 'deposit', 'investment')
+
+HOLDER_PATTERN = re.compile(r"^([a-zA-Z]{2,}\s[a-zA-Z]{1,}'?-?[a-zA-Z]{2,}\s?([a-zA-Z]{1,})?)")
+
+_holder_match = HOLDER_PATTERN.match
+
+def enable_holder_cache(maxsize=65536) -> None:
+    """Memoise holder name checks, for imports where the same names recur."""
+    global _holder_match
+    _holder_match = lru_cache(maxsize=maxsize)(lambda name: HOLDER_PATTERN.match(name) is not None)
+
+def disable_holder_cache() -> None:
+    global _holder_match
+    _holder_match = HOLDER_PATTERN.match
+
+def account_number_error(account_number):
+    """The exception validate_account_number would raise, or None."""
+    if type(account_number) is str and len(account_number) == 6 and account_number.isdigit():
+        return None
+
+    if not isinstance(account_number, str):
+        return TypeError(f"Invalid account number. Account number must of type string.")
+
+    if not account_number.isdigit():
+        return ValueError(f"Invalid account number. Account number must contain only digits.")
+
+    if len(account_number) != 6:
+        return ValueError(f"Invalid account number. Account number must only be of length 6.")
+
+    return None
+
+def account_holder_error(account_holder):
+    if not isinstance(account_holder, str):
+        return TypeError(f"Invalid account name. Account name must be of type string.")
+    if not _holder_match(account_holder):
+        return ValueError(f"Invalid account name. Account name must be first name followed by last name.")
+    return None
+
+def record_error(account_number, account_holder, opening_balance, account_type):
+    """First validation failure for one account record, in Account.__init__ order."""
+    error = account_number_error(account_number) or account_holder_error(account_holder)
+    if error:
+        return error
+
+    try:
+        negative = opening_balance < 0
+    except TypeError:
+        return TypeError(f"Invalid opening balance. Opening balance must be a number.")
+    if negative:
+        return ValueError(f"Opening balance must be positive!")
+
+    if account_type not in TYPES:
+        return ValueError(f"Invalid account type. Account must be one of the following: {TYPES}")
+
+    return None
+
+def validate_account_number(account_number) -> None:
+    error = account_number_error(account_number)
+    if error:
+        raise error
+
+def validate_account_holder(account_holder) -> None:
+    error = account_holder_error(account_holder)
+    if error:
+        raise error
+
+def validate(account_number, account_holder, opening_balance, account_type) -> None:
+    error = record_error(account_number, account_holder, opening_balance, account_type)
+    if error:
+        raise error
+
+def validate_many(records) -> list:
+    """Check (account_number, account_holder, opening_balance, account_type) records.
+
+    Returns every failure as (index, exception) rather than stopping at the first.
+    """
+    failures = []
+    for index, record in enumerate(records):
+        error = record_error(*record)
+        if error:
+            failures.append((index, error))
+    return failures
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# Mark-to-model valuation of the investment accounts of an AccountBook.
+# Each risk level has an annual (expected return, volatility) scenario.
+# Account values follow a one-step lognormal model over the horizon:
+#
+#     value = balance * exp((mu - sigma**2 / 2) * horizon + sigma * sqrt(horizon) * z)
+#
+# z mixes one market shock per path, shared by every account, with a shock
+# of the account's own; correlation sets the weight of the market shock.
+#
+# This module is the only part of the package that needs NumPy. NumPy is
+# imported when an engine is created, so the rest of the package does not
+# depend on it.
+#
+
+from bank_account.account import Account, InvestmentAccount
+
+# risk level: (expected annual return, annual volatility)
+SCENARIOS = {'low':    (0.03, 0.05),
+             'medium': (0.06, 0.12),
+             'high':   (0.10, 0.25)}
+
+PERCENTILES = (1, 5, 50, 95, 99)
+
+_INVESTMENT = Account.TYPES.index('investment')
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(f"bank_account.valuation requires NumPy. Install it with 'pip install numpy'.") from None
+    return numpy
+
+class ValuationEngine:
+
+    """Values every investment account of an AccountBook under per-risk-level scenarios.
+
+    Monte Carlo paths are generated in chunks sized to memory_budget bytes,
+    so the working set does not grow with the book times the number of
+    paths. Beyond the chunk, 48 bytes per path are kept for the quantiles.
+    Results are in major units.
+    """
+
+    def __init__(self,
+                 book,
+                 scenarios=None,
+                 horizon=1.0,
+                 correlation=0.5,
+                 memory_budget=64 * 2**20,
+                 seed=None) -> None:
+
+        scenarios = dict(SCENARIOS, **(scenarios or {}))
+        unknown   = set(scenarios) - set(InvestmentAccount.RISK_TYPES)
+        if unknown:
+            raise ValueError(f"Invalid risk type {sorted(unknown)}. Scenarios must use the following: {InvestmentAccount.RISK_TYPES}")
+        if not 0 <= correlation <= 1:
+            raise ValueError(f"Correlation must be between 0 and 1.")
+        if horizon <= 0:
+            raise ValueError(f"Horizon must be positive.")
+
+        np = self._np = _numpy()
+        types = np.frombuffer(book.types, dtype=np.int8)
+        rows  = np.flatnonzero(types == _INVESTMENT)
+
+        self.book          = book
+        self.scenarios     = scenarios
+        self.horizon       = horizon
+        self.correlation   = correlation
+        self.memory_budget = memory_budget
+        self.rng           = np.random.default_rng(seed)
+        self.numbers       = np.frombuffer(book.numbers, dtype=np.int32)[rows].copy()
+        self.balances      = np.frombuffer(book.balances, dtype=np.int64)[rows] / 100
+        self.risks         = np.frombuffer(book.risks, dtype=np.int8)[rows].astype(np.intp)
+
+        mu, sigma = np.array([scenarios[level] for level in InvestmentAccount.RISK_TYPES]).T
+        self._mu    = mu
+        self._drift = (mu - sigma ** 2 / 2) * horizon
+        self._vol   = sigma * horizon ** 0.5
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def mark(self, returns=None) -> dict:
+        """Values after applying one return per risk level to every account at once.
+
+        returns maps risk level to a return over the horizon; levels that are
+        not given use the scenario's expected return.
+        """
+        np   = self._np
+        rate = self._mu * self.horizon
+        for level, value in (returns or {}).items():
+            rate[InvestmentAccount.RISK_TYPES.index(level)] = value
+        values = self.balances * (1 + rate[self.risks])
+        return {'numbers': self.numbers,
+                'values':  values,
+                'buckets': self._by_risk(np.bincount(self.risks, weights=values, minlength=3))}
+
+    def simulate(self, paths=10_000, confidence=0.99, percentiles=PERCENTILES) -> dict:
+        """Monte Carlo value distributions per account, per risk level and in total.
+
+        VaR is the loss over the horizon not exceeded with the given
+        confidence, as a positive amount. Percentiles are of value at the
+        horizon.
+        """
+        np       = self._np
+        count    = len(self)
+        chunk    = self.chunk_size()
+        quantile = np.array([1 - confidence, *(p / 100 for p in percentiles)])
+
+        # Every account at one risk level has the same return distribution,
+        # so per-account figures scale one return sample per level. Columns
+        # 1-3 of each shock chunk are a reference account at each level, and
+        # the rest are the book. Per path only the three bucket gains are
+        # kept, from a product with a balance-weighted (accounts x 3) matrix.
+        risks   = np.concatenate((np.arange(3), self.risks))
+        drift   = self._drift[risks]
+        vol     = self._vol[risks]
+        weights = np.zeros((count, 3))
+        weights[np.arange(count), self.risks] = self.balances
+        returns = np.empty((paths, 3))
+        buckets = np.empty((paths, 3))
+        market  = self.correlation ** 0.5
+        own     = (1 - self.correlation) ** 0.5
+        for start in range(0, paths, chunk):
+            stop  = min(start + chunk, paths)
+            shock = self.rng.standard_normal((stop - start, count + 4))
+            moves = shock[:, 1:]
+            moves *= own
+            moves += market * shock[:, :1]
+            moves *= vol
+            moves += drift
+            np.expm1(moves, out=moves)
+            returns[start:stop] = moves[:, :3]
+            buckets[start:stop] = moves[:, 3:] @ weights
+
+        base      = np.bincount(self.risks, weights=self.balances, minlength=3)
+        level_q   = np.quantile(returns, quantile, axis=0)
+        bucket_q  = np.quantile(buckets, quantile, axis=0)
+        total_q   = np.quantile(buckets.sum(axis=1), quantile)
+        account_q = level_q[:, self.risks] * self.balances
+
+        return {'paths':      paths,
+                'confidence': confidence,
+                'accounts':   {'numbers':     self.numbers,
+                               'var':         0.0 - np.minimum(account_q[0], 0.0),
+                               'percentiles': dict(zip(percentiles, self.balances + account_q[1:]))},
+                'buckets':    {level: {'value':       float(base[code]),
+                                       'var':         float(0.0 - min(bucket_q[0, code], 0.0)),
+                                       'percentiles': _floats(percentiles, base[code] + bucket_q[1:, code])}
+                               for code, level in enumerate(InvestmentAccount.RISK_TYPES)},
+                'total':      {'value':       float(base.sum()),
+                               'var':         float(0.0 - min(total_q[0], 0.0)),
+                               'percentiles': _floats(percentiles, base.sum() + total_q[1:])}}
+
+    def chunk_size(self) -> int:
+        """Paths per chunk, so that one chunk of shocks fits in the memory budget."""
+        return max(1, self.memory_budget // (8 * (len(self) + 4)))
+
+    def _by_risk(self, totals) -> dict:
+        return {level: float(totals[code]) for code, level in enumerate(InvestmentAccount.RISK_TYPES)}
+
+def _floats(percentiles, values) -> dict:
+    return {pct: float(value) for pct, value in zip(percentiles, values)}
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+#
+# Usage: python -m benchmarks.accounts [--scales 1000,100000,1000000]
+#                                      [--output results.json]
+#                                      [--baseline baseline.json] [--tolerance 0.1]
+#
+# Times account construction, posting, overdraft checks, interest and
+# transaction iteration at several scales. Results are written as JSON in
+# nanoseconds per operation. With --baseline, each case is compared to a
+# stored result file and the exit status is 1 if any case is slower than
+# the baseline by more than the tolerance.
+#
+
+import os
+
+# Benchmarks measure the undecorated methods; this must happen before
+# bank_account.account is imported.
+os.environ.setdefault('BANK_ACCOUNT_TIMER', 'off')
+
+import argparse
+import json
+import platform
+import sys
+from time import perf_counter_ns
+
+from bank_account.account import Account, BalanceError, CurrentAccount, DepositAccount
+
+SCALES = (1_000, 100_000, 1_000_000)
+
+def _numbers(n):
+    return [f"{i % 1_000_000:06d}" for i in range(n)]
+
+def construct(n):
+    numbers = _numbers(n)
+    def run():
+        for number in numbers:
+            Account(number, 'jane dole', 104, 'savings')
+    return run
+
+def deposit(n):
+    accounts = [Account(number, 'jane dole', 104, 'savings') for number in _numbers(n)]
+    def run():
+        for account in accounts:
+            account.deposit(1)
+    return run
+
+def withdraw(n):
+    accounts = [Account(number, 'jane dole', 104, 'savings') for number in _numbers(n)]
+    def run():
+        for account in accounts:
+            account.withdraw(1)
+    return run
+
+def current_withdraw(n):
+    accounts = [CurrentAccount(number, 'jon smith', 104, -10**12) for number in _numbers(n)]
+    def run():
+        for account in accounts:
+            account.withdraw(1)
+    return run
+
+def current_withdraw_rejected(n):
+    accounts = [CurrentAccount(number, 'jon smith', 104, 100) for number in _numbers(n)]
+    def run():
+        for account in accounts:
+            try:
+                account.withdraw(10)
+            except BalanceError:
+                pass
+    return run
+
+def current_try_withdraw_rejected(n):
+    accounts = [CurrentAccount(number, 'jon smith', 104, 100) for number in _numbers(n)]
+    def run():
+        for account in accounts:
+            account.try_withdraw(10)
+    return run
+
+def deposit_interest(n):
+    accounts = [DepositAccount(number, 'jony smith', 109, 0.05) for number in _numbers(n)]
+    def run():
+        for account in accounts:
+            account.interest()
+    return run
+
+def iterate_transactions(n):
+    account = Account('567891', 'jane dole', 104, 'savings', list(range(n)))
+    def run():
+        for _ in account:
+            pass
+    return run
+
+CASES = {
+    'construct':                     construct,
+    'deposit':                       deposit,
+    'withdraw':                      withdraw,
+    'current_withdraw':              current_withdraw,
+    'current_withdraw_rejected':     current_withdraw_rejected,
+    'current_try_withdraw_rejected': current_try_withdraw_rejected,
+    'deposit_interest':              deposit_interest,
+    'iterate_transactions':          iterate_transactions,
+}
+
+def measure(case, n, repeat=3) -> float:
+    """Best of repeat runs, in nanoseconds per operation."""
+    run  = CASES[case](n)
+    best = None
+    for _ in range(repeat):
+        start   = perf_counter_ns()
+        run()
+        elapsed = perf_counter_ns() - start
+        best    = elapsed if best is None else min(best, elapsed)
+    return best / n
+
+def run_suite(scales=SCALES, cases=None, repeat=3) -> dict:
+    results = {}
+    for case in cases or CASES:
+        results[case] = {str(n): measure(case, n, repeat) for n in scales}
+    return {'python':   platform.python_version(),
+            'platform': platform.platform(),
+            'unit':     'ns/op',
+            'results':  results}
+
+def compare(current, baseline, tolerance=0.1) -> list:
+    """(case, scale, baseline, current, ratio) for every case slower than allowed."""
+    regressions = []
+    for case, scales in current['results'].items():
+        for scale, value in scales.items():
+            reference = baseline['results'].get(case, {}).get(scale)
+            if reference and value / reference > 1 + tolerance:
+                regressions.append((case, scale, reference, value, value / reference))
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Account benchmark suite.')
+    parser.add_argument('--scales', default=','.join(map(str, SCALES)))
+    parser.add_argument('--cases', default=None, help='comma separated subset of ' + ', '.join(CASES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', default=None)
+    parser.add_argument('--baseline', default=None)
+    parser.add_argument('--tolerance', type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    scales  = [int(scale) for scale in args.scales.split(',')]
+    cases   = args.cases.split(',') if args.cases else None
+    current = run_suite(scales, cases, args.repeat)
+
+    for case, values in current['results'].items():
+        print(f"{case:31}" + ''.join(f" {scale:>9}: {value:9.1f} ns/op" for scale, value in values.items()))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(current, json.load(f), args.tolerance)
+        for case, scale, reference, value, ratio in regressions:
+            print(f"REGRESSION {case} at {scale}: {reference:.1f} -> {value:.1f} ns/op ({ratio:.2f}x)")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+#
+# Usage: python -m benchmarks.memory [-n INSTANCES]
+#
+# Compares the memory held by N current accounts in each account variant.
+#
+
+import argparse
+import gc
+import tracemalloc
+
+import bank_account.account as dict_based
+import bank_account.slotted as slotted
+import fintech.accounts as fintech
+from bank_account.book import AccountBook
+
+def _holders(n):
+    return [f"holder {chr(97 + i % 26)}{chr(97 + i // 26 % 26)}son" for i in range(n)]
+
+def measure(build, n) -> int:
+    holders = _holders(n)
+    gc.collect()
+    tracemalloc.start()
+    accounts = build(n, holders)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del accounts
+    return size
+
+VARIANTS = {
+    'bank_account.account': lambda n, holders: [dict_based.CurrentAccount(f"{i:06d}", holders[i], 100, -100, ())
+                                                for i in range(n)],
+    'fintech.accounts':     lambda n, holders: [fintech.CurrentAccount(f"{i:06d}", holders[i], 100, -100)
+                                                for i in range(n)],
+    'bank_account.slotted': lambda n, holders: [slotted.CurrentAccount(f"{i:06d}", holders[i], 100, -100, ())
+                                                for i in range(n)],
+    'bank_account.book':    lambda n, holders: _book(n, holders),
+}
+
+def _book(n, holders):
+    book = AccountBook()
+    for i in range(n):
+        book.open(f"{i:06d}", holders[i], 100, 'current', overdraft_limit=-100)
+    return book
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Memory held per account variant.')
+    parser.add_argument('-n', '--instances', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for name, build in VARIANTS.items():
+        size = measure(build, args.instances)
+        print(f"{name:22} {size / 2**20:9.1f} MiB  {size / args.instances:7.1f} bytes/account")
+
+if __name__ == '__main__':
+    main()
@@ -3,3 +3,21 @@
 # Usage: .py
 #
 
+
+import bank_account.account as acc
+from bank_account.account import set_timer_mode
+
+class TimerModeMixin:
+
+    """Runs every test in timer_mode and restores the previous mode afterwards.
+
+    Tests may switch modes themselves; the mode in place before setUp is
+    still the one restored.
+    """
+
+    timer_mode = 'off'
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(set_timer_mode, acc.timer_mode)
+        set_timer_mode(self.timer_mode)
@@ -6,18 +6,44 @@
 from timeit import timeit
 import unittest
 
-from bank_account.account import timer
+from bank_account.account import timer, set_timer_mode, timings, reset_timings
+import bank_account.account as acc
 from bank_account.account import Account
+from tests import TimerModeMixin
+
+class TestTimer(TimerModeMixin, unittest.TestCase):
+    timer_mode = 'print'
 
-class TestTimer(unittest.TestCase):
     def test_timer_decorator(self):
         @timer
         def to_be_decorated(self, amount):
             pass
         to_be_decorated(self, amount=10)
 
+    def test_timer_returns_wrapped_result(self):
+        @timer
+        def to_be_decorated(self, amount):
+            return amount * 2
+        self.assertEqual(to_be_decorated(self, amount=10), 20)
+
+    def test_timer_record_mode_collects_histograms(self):
+        @timer
+        def deposit(self, amount):
+            pass
+        set_timer_mode('record')
+        reset_timings()
+        for amount in range(100):
+            deposit(self, amount)
+        stats = timings()[('TestTimer', 'deposit')]
+        self.assertEqual(stats['count'], 100)
+        self.assertLessEqual(stats['p50'], stats['p99'])
+        self.assertLessEqual(stats['p99'], stats['max'])
+
+    def test_timer_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            set_timer_mode('loud')
+
 from bank_account.account import AmountError, BalanceError
-import bank_account.account as acc
 
 class AmountErrorTest(unittest.TestCase):
     def test_account_amount_error_deposit(self):
@@ -299,3 +325,48 @@ class InvestmentAccountTest(unittest.TestCase):
 
 
 
+
+import bank_account.core as core
+import fintech.accounts as accounts
+
+class SharedCoreTest(unittest.TestCase):
+    def test_facades_share_the_core_hierarchy(self):
+        for module in (acc, accounts):
+            self.assertTrue(issubclass(module.CurrentAccount, core.CurrentAccount))
+            self.assertTrue(issubclass(module.CurrentAccount, module.Account))
+        self.assertIs(accounts.BalanceError, acc.BalanceError)
+
+    def test_facades_keep_separate_instance_counts(self):
+        before = (acc.Account.instance_count, accounts.Account.instance_count)
+        accounts.DepositAccount('345123', 'John saul', 23.55, 0.5)
+        self.assertEqual(acc.Account.instance_count, before[0])
+        self.assertEqual(accounts.Account.instance_count, before[1] + 1)
+
+    def test_fintech_lazy_exports(self):
+        from bank_account.book import AccountBook
+        self.assertIs(accounts.AccountBook, AccountBook)
+        with self.assertRaises(AttributeError):
+            accounts.NoSuchThing
+
+class ResultCodeTest(TimerModeMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        core.reset_rejections()
+
+    def test_try_postings_return_status(self):
+        account = acc.CurrentAccount('912379', 'sally jones', 117, -50)
+        self.assertIs(account.try_deposit(10), core.PostingStatus.POSTED)
+        self.assertIs(account.try_withdraw(-10), core.PostingStatus.INVALID_AMOUNT)
+        self.assertIs(account.try_withdraw(1000), core.PostingStatus.OVERDRAFT_LIMIT)
+        self.assertIs(account.try_withdraw(177), core.PostingStatus.POSTED)
+        self.assertEqual(account.get_balance, -50)
+
+    def test_rejections_are_counted_in_both_modes(self):
+        fintech_account = accounts.DepositAccount('345123', 'John saul', 23.55, 0.5)
+        self.assertIs(fintech_account.try_deposit(1.5), core.PostingStatus.INVALID_AMOUNT)
+        with self.assertRaises(core.AmountError):
+            fintech_account.withdraw(-1)
+        with self.assertRaises(core.BalanceError):
+            acc.CurrentAccount('912379', 'sally jones', 117, 50).withdraw(100)
+        self.assertEqual(accounts.rejections(), {(core.PostingStatus.INVALID_AMOUNT, 'deposit'): 2,
+                                               (core.PostingStatus.OVERDRAFT_LIMIT, 'current'): 1})
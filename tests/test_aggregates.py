@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account.account import Account, CurrentAccount, InvestmentAccount
+from bank_account.aggregates import PortfolioAggregates
+from tests import TimerModeMixin
+
+class PortfolioAggregatesTest(TimerModeMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.aggregates = PortfolioAggregates()
+        self.aggregates.attach(CurrentAccount)
+        self.aggregates.attach(InvestmentAccount)
+
+    def tearDown(self):
+        self.aggregates.detach(CurrentAccount)
+        self.aggregates.detach(InvestmentAccount)
+
+    def test_creation_and_postings_update_aggregates(self):
+        first  = CurrentAccount('912379', 'sally jones', 117, -50)
+        second = CurrentAccount('891237', 'jon jones', 15, -1500)
+        high   = InvestmentAccount('891234', 'jony smith', 109, 'high')
+        first.withdraw(150)
+        second.withdraw(100)
+        second.deposit(30)
+        high.deposit(1)
+
+        snapshot = self.aggregates.snapshot()
+        self.assertEqual(snapshot['by_type']['current'], {'balance': -88, 'count': 2, 'exposure': 88})
+        self.assertEqual(snapshot['by_type']['investment'], {'balance': 110, 'count': 1, 'exposure': 0})
+        self.assertEqual(snapshot['by_risk'], {'high': {'balance': 110, 'count': 1, 'exposure': 0}})
+        self.assertEqual(self.aggregates.verify([first, second, high]), [])
+
+    def test_verify_reports_drift(self):
+        tracked   = CurrentAccount('912379', 'sally jones', 117, -50)
+        untracked = Account('567891', 'jane dole', 104, 'savings')
+        tracked._balance -= 15000
+        drift = self.aggregates.verify([tracked, untracked])
+        self.assertIn(('by_type', 'current', 'balance', -33, 117), drift)
+        self.assertIn(('by_type', 'current', 'exposure', 33, 0), drift)
+        self.assertIn(('by_type', 'savings', 'count', 1, 0), drift)
+
+    def test_add_existing_accounts(self):
+        aggregates = PortfolioAggregates([Account('567891', 'jane dole', 104, 'savings')])
+        self.assertEqual(aggregates.snapshot()['by_type'], {'savings': {'balance': 104, 'count': 1, 'exposure': 0}})
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+# Allocation audit of the deposit/withdraw hot path. A successful posting
+# may only replace the balance int; any string formatting or object built
+# per call shows up as growth in the traced peak.
+#
+
+import contextlib
+import io
+import tracemalloc
+import unittest
+
+from bank_account import core, slotted
+from bank_account.account import AmountError, BalanceError
+import bank_account.account as acc
+from bank_account.book import AccountBook
+from bank_account.money import Money
+import fintech.accounts as accounts
+from tests import TimerModeMixin
+
+POSTINGS = 2000
+
+# Bytes; a few int temporaries fit, a single rendered message does not.
+PEAK_LIMIT   = 256
+GROWTH_LIMIT = 128
+
+def _accounts():
+    book = AccountBook()
+    book.open('111111', 'jane dole', 104, 'savings')
+    book.open('222222', 'jon smith', 106, 'current', overdraft_limit=-100)
+    return [core.Account('567891', 'jane dole', 104, 'savings'),
+            core.CurrentAccount('912379', 'sally jones', 117, -50),
+            acc.Account('567891', 'jane dole', 104, 'savings'),
+            acc.CurrentAccount('912379', 'sally jones', 117, -50),
+            acc.DepositAccount('891234', 'jony smith', 109, 0.5),
+            acc.InvestmentAccount('891234', 'jony smith', 109, 'high'),
+            slotted.Account('567891', 'jane dole', 104, 'savings'),
+            slotted.CurrentAccount('912379', 'sally jones', 117, -50),
+            accounts.CurrentAccount('123123', 'John smith', 10.05, -100.0),
+            accounts.DepositAccount('345123', 'John saul', 23.55, 0.5),
+            accounts.InvestmentAccount('567123', 'Phoebe jones', 12.45, 'high'),
+            book['111111'],
+            book['222222']]
+
+class _Loud(core.CurrentAccount):
+
+    """Fails the test if anything renders the account."""
+
+    def __str__(self):
+        raise AssertionError('account rendered on the posting path')
+
+    __repr__ = __str__
+
+class HotPathAllocationTest(TimerModeMixin, unittest.TestCase):
+    def _traced(self, post):
+        post()
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            for _ in range(POSTINGS):
+                post()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return current - start, peak - start
+
+    def test_successful_postings_do_not_allocate(self):
+        for account in _accounts():
+            for amount in (1, Money(5)):
+                def post():
+                    account.deposit(amount)
+                    account.withdraw(amount)
+                with self.subTest(account=type(account).__qualname__, amount=amount):
+                    growth, peak = self._traced(post)
+                    self.assertLess(growth, GROWTH_LIMIT)
+                    self.assertLess(peak, PEAK_LIMIT)
+
+    def test_rejections_render_nothing_until_read(self):
+        account = _Loud('912379', 'sally jones', 117, -50)
+        with self.assertRaises(AmountError) as raised:
+            account.deposit(-1)
+        with self.assertRaises(BalanceError):
+            account.withdraw(1000)
+        self.assertIs(account.try_withdraw(1000), core.PostingStatus.OVERDRAFT_LIMIT)
+        with self.assertRaises(AssertionError):
+            str(raised.exception)
+
+    def test_fintech_attribute_miss_is_silent(self):
+        account = accounts.DepositAccount('345123', 'John saul', 23.55, 0.5)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(account.branch, -1)
+        self.assertEqual(output.getvalue(), '')
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from benchmarks.accounts import CASES, compare, run_suite
+
+class BenchmarkSuiteTest(unittest.TestCase):
+    def test_run_suite_covers_every_case_and_scale(self):
+        results = run_suite(scales=(10, 20), repeat=1)
+        self.assertEqual(set(results['results']), set(CASES))
+        for values in results['results'].values():
+            self.assertEqual(set(values), {'10', '20'})
+            self.assertTrue(all(value > 0 for value in values.values()))
+
+    def test_compare_flags_only_slow_cases(self):
+        baseline = {'results': {'deposit': {'1000': 100.0}, 'withdraw': {'1000': 100.0}}}
+        current  = {'results': {'deposit': {'1000': 105.0}, 'withdraw': {'1000': 150.0},
+                                'construct': {'1000': 900.0}}}
+        self.assertEqual(compare(current, baseline, tolerance=0.1),
+                         [('withdraw', '1000', 100.0, 150.0, 1.5)])
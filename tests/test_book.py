@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account.account import AmountError, BalanceError
+from bank_account.account import CurrentAccount, DepositAccount, InvestmentAccount
+from bank_account.book import AccountBook
+from bank_account.money import Money
+
+class AccountBookTest(unittest.TestCase):
+    def setUp(self):
+        self.book = AccountBook()
+        self.book.open('123456', 'John Smith', 100, 'savings')
+        self.book.open('789123', 'jon smith', 106, 'current', overdraft_limit=-100)
+        self.book.open('891234', 'jony smith', 109, 'deposit', interest_rate=0.5)
+        self.book.open('912347', 'jonny jones', 115, 'investment', risk_level='high')
+
+    def test_book_has_length(self):
+        self.assertEqual(len(self.book), 4)
+
+    def test_book_contains_account_number(self):
+        self.assertIn('123456', self.book)
+        self.assertNotIn('654321', self.book)
+
+    def test_book_lookups_outside_the_number_space(self):
+        self.book.open('999999', 'Jane Smith', 100, 'savings')
+        for number in (-1, '-1', 1_000_000):
+            self.assertNotIn(number, self.book)
+            with self.assertRaises(KeyError):
+                self.book[number]
+
+    def test_failed_open_leaves_no_partial_row(self):
+        with self.assertRaises(ValueError):
+            self.book.open('300001', 'Jane Smith', 10**18, 'savings')
+        with self.assertRaises(ValueError):
+            self.book.open('300001', 'Jane Smith', 100, 'deposit', interest_rate='5%')
+        self.assertNotIn('300001', self.book)
+        self.assertEqual(len(self.book), 4)
+        self.assertEqual(len(self.book.balances), 4)
+
+    def test_book_rejects_duplicate_account_number(self):
+        with self.assertRaises(ValueError):
+            self.book.open('123456', 'Jane Smith', 100, 'savings')
+
+    def test_book_only_allows_for_valid_type(self):
+        with self.assertRaises(ValueError):
+            self.book.open('567891', 'jane dole', 104, 'practice')
+
+    def test_view_deposit_and_withdraw(self):
+        view = self.book['123456']
+        view.deposit(20)
+        view.withdraw(50)
+        self.assertEqual(view.get_balance, 70)
+        self.assertEqual(self.book.balances[self.book.row('123456')], 7000)
+
+    def test_view_amount_error(self):
+        with self.assertRaises(AmountError):
+            self.book['123456'].deposit(-1)
+
+    def test_current_view_balance_error(self):
+        with self.assertRaises(BalanceError):
+            self.book['789123'].withdraw(500)
+
+    def test_deposit_view_interest(self):
+        self.assertEqual(self.book['891234'].interest(), 109 * 0.5)
+
+    def test_investment_view_risk_level(self):
+        self.assertEqual(self.book['912347'].risk_level, 'high')
+
+    def test_book_from_accounts(self):
+        book = AccountBook.from_accounts([
+            CurrentAccount('789123', 'jon smith', 106, 1000, [20, 30]),
+            DepositAccount('123729', 'jony ellis', 132, 0.7, [20, 30]),
+            InvestmentAccount('123730', 'jonny ellis', 121, 'low', [20, 30]),
+        ])
+        self.assertEqual([view.account_type for view in book], ['current', 'deposit', 'investment'])
+        self.assertEqual(book['789123'].overdraft_limit, 1000)
+        self.assertEqual(book['123729'].interest_rate, 0.7)
+        self.assertEqual(book['123730'].risk_level, 'low')
+
+from bank_account.account import PostingStatus
+
+class PostBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.book = AccountBook()
+        self.book.open('123456', 'John Smith', 100, 'savings')
+        self.book.open('789123', 'jon smith', 106, 'current', overdraft_limit=-100)
+
+    def test_post_batch_applies_signed_amounts(self):
+        status = self.book.post_batch(['123456', '789123', '123456'], [50, -200, -30])
+        self.assertEqual(list(status), [PostingStatus.POSTED] * 3)
+        self.assertEqual(self.book['123456'].get_balance, 120)
+        self.assertEqual(self.book['789123'].get_balance, -94)
+
+    def test_post_batch_reports_rejections(self):
+        status = self.book.post_batch([123456, 123456, 789123, 654321], [0, 1.5, -300, 10])
+        self.assertEqual(list(status), [PostingStatus.INVALID_AMOUNT,
+                                        PostingStatus.INVALID_AMOUNT,
+                                        PostingStatus.OVERDRAFT_LIMIT,
+                                        PostingStatus.UNKNOWN_ACCOUNT])
+        self.assertEqual(self.book['123456'].get_balance, 100)
+        self.assertEqual(self.book['789123'].get_balance, 106)
+
+    def test_post_batch_overdraft_sees_earlier_rows(self):
+        status = self.book.post_batch(['789123', '789123'], [-150, -100])
+        self.assertEqual(list(status), [PostingStatus.POSTED, PostingStatus.OVERDRAFT_LIMIT])
+
+    def test_post_batch_rejects_int64_overflow(self):
+        status = self.book.post_batch(['123456', '123456', '123456'], [10**19, 2**63, 5], minor=True)
+        self.assertEqual(list(status), [PostingStatus.INVALID_AMOUNT,
+                                        PostingStatus.INVALID_AMOUNT,
+                                        PostingStatus.POSTED])
+        self.assertEqual(self.book['123456'].minor_balance, 10005)
+
+    def test_view_postings_reject_int64_overflow(self):
+        view = self.book['123456']
+        with self.assertRaises(AmountError):
+            view.deposit(Money(2**63))
+        self.assertEqual(view.try_deposit(Money(2**63)), PostingStatus.INVALID_AMOUNT)
+        self.assertEqual(self.book['789123'].try_withdraw(Money(2**63)), PostingStatus.OVERDRAFT_LIMIT)
+        self.assertEqual(view.minor_balance, 10000)
+
+    def test_post_batch_requires_equal_lengths(self):
+        with self.assertRaises(ValueError):
+            self.book.post_batch(['123456'], [1, 2])
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import csv
+import os
+import tempfile
+import unittest
+
+from bank_account.bulk import (export_accounts, export_accounts_binary, export_transactions,
+                               import_accounts, import_accounts_binary, import_transactions)
+from bank_account.journal import Journal
+
+ACCOUNTS = """account_number,account_holder,opening_balance,account_type,overdraft_limit,interest_rate,risk_level
+123456,John Smith,100,savings,,,
+789123,jon smith,106.50,current,-100,,
+891234,jony smith,109,deposit,,0.5,
+912347,jonny jones,115,investment,,,high
+891234,jony smith,109,investment,,,high
+12345,jon ellis,120,savings,,,
+567891,jane dole,-1,savings,,,
+567892,jane dole,ten,savings,,,
+567893,jane dole,10,investment,,,extreme
+"""
+
+TRANSACTIONS = """account_number,amount
+123456,20
+789123,-300
+789123,-206.50
+999999,5
+891234,0.001
+912347,
+"""
+
+class BulkTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.accounts  = self._write('accounts.csv', ACCOUNTS)
+        self.rejects   = self._path('rejects.csv')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def _write(self, name, text):
+        path = self._path(name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def _rejects(self):
+        with open(self.rejects, newline='') as f:
+            return list(csv.reader(f))[1:]
+
+    def test_import_accounts_reports_rejected_rows(self):
+        book, loaded, rejected = import_accounts(self.accounts, rejects=self.rejects, chunk_size=3)
+        self.assertEqual((loaded, rejected), (4, 5))
+        self.assertEqual(book['789123'].get_balance, 106.5)
+        self.assertEqual(book['789123'].overdraft_limit, -100)
+        self.assertEqual(book['891234'].interest_rate, 0.5)
+        self.assertEqual(book['912347'].risk_level, 'high')
+        self.assertEqual([row[0] for row in self._rejects()], ['6', '7', '8', '9', '10'])
+        self.assertIn('already in the book', self._rejects()[0][-1])
+
+    def test_accounts_round_trip(self):
+        book, _, _ = import_accounts(self.accounts)
+        exported = self._path('exported.csv')
+        self.assertEqual(export_accounts(book, exported), 4)
+        reloaded, loaded, rejected = import_accounts(exported)
+        self.assertEqual((loaded, rejected), (4, 0))
+        self.assertEqual([repr(view) for view in reloaded], [repr(view) for view in book])
+
+        binary = self._path('accounts.bin')
+        export_accounts_binary(book, binary)
+        self.assertEqual([repr(view) for view in import_accounts_binary(binary)], [repr(view) for view in book])
+
+    def test_import_transactions(self):
+        book, _, _ = import_accounts(self.accounts)
+        journal_path = self._path('journal.bin')
+        with Journal(journal_path) as journal:
+            posted, rejected = import_transactions(self._write('transactions.csv', TRANSACTIONS),
+                                                   book, rejects=self.rejects, journal=journal, chunk_size=2)
+        self.assertEqual((posted, rejected), (2, 4))
+        self.assertEqual(book['123456'].get_balance, 120)
+        self.assertEqual(book['789123'].get_balance, -100)
+        self.assertEqual([(row[0], row[-1]) for row in self._rejects()],
+                         [('3', 'OVERDRAFT_LIMIT'), ('5', 'UNKNOWN_ACCOUNT'),
+                          ('6', 'INVALID_AMOUNT'), ('7', 'INVALID_AMOUNT')])
+
+        exported = self._path('transactions_out.csv')
+        self.assertEqual(export_transactions(journal_path, exported), 2)
+        with open(exported, newline='') as f:
+            self.assertEqual([row[:2] for row in csv.reader(f)][1:], [['123456', '20.00'], ['789123', '-206.50']])
+
+    def test_amounts_outside_int64_or_ascii_digits_are_rejected(self):
+        accounts = self._write('wide.csv', ACCOUNTS.splitlines()[0] + "\n"
+                                           "123456,John Smith,1e20,savings,,,\n"
+                                           "789123,jon smith,\u00b2,savings,,,\n"
+                                           "891234,jony smith,10,current,-1e20,,\n"
+                                           "912347,jonny jones,92233720368547759,savings,,,\n")
+        book, loaded, rejected = import_accounts(accounts, rejects=self.rejects)
+        self.assertEqual((loaded, rejected), (0, 4))
+        self.assertEqual(len(book), 0)
+
+        book, _, _ = import_accounts(self.accounts)
+        transactions = self._write('wide_transactions.csv', "account_number,amount\n123456,1e20\n123456,\u00b2\n")
+        self.assertEqual(import_transactions(transactions, book), (0, 2))
+
+    def test_import_transactions_keeps_timestamps(self):
+        book, _, _ = import_accounts(self.accounts)
+        journal_path = self._path('journal.bin')
+        transactions = self._write('timed.csv', "account_number,amount,timestamp\n"
+                                                "123456,20,1700000000000000000\n"
+                                                "123456,5,yesterday\n"
+                                                "123456,-5,\n")
+        with Journal(journal_path) as journal:
+            self.assertEqual(import_transactions(transactions, book, rejects=self.rejects, journal=journal), (2, 1))
+        self.assertIn('Invalid timestamp', self._rejects()[0][-1])
+
+        exported = self._path('timed_out.csv')
+        export_transactions(journal_path, exported)
+        with open(exported, newline='') as f:
+            rows = list(csv.reader(f))[1:]
+        self.assertEqual(rows[0], ['123456', '20.00', '1700000000000000000'])
+        self.assertGreater(int(rows[1][2]), 1700000000000000000)
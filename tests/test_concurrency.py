@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import threading
+import unittest
+
+from bank_account.account import BalanceError, CurrentAccount
+from bank_account.concurrency import AccountLocks
+from tests import TimerModeMixin
+
+class AccountLocksTest(TimerModeMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.locks  = AccountLocks(stripes=8)
+        self.first  = CurrentAccount('100001', 'jon smith', 1000, -100, [])
+        self.second = CurrentAccount('100002', 'sam jones', 1000, -100, [])
+
+    def test_concurrent_deposits_are_not_lost(self):
+        def work():
+            for _ in range(1000):
+                self.locks.deposit(self.first, 1)
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.first.get_balance, 9000)
+
+    def test_opposing_transfers_do_not_deadlock(self):
+        def work(source, target):
+            for _ in range(500):
+                self.locks.transfer(source, target, 1)
+        threads = [threading.Thread(target=work, args=(self.first, self.second)),
+                   threading.Thread(target=work, args=(self.second, self.first))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(self.first.get_balance + self.second.get_balance, 2000)
+
+    def test_failed_transfer_leaves_balances_unchanged(self):
+        with self.assertRaises(BalanceError):
+            self.locks.transfer(self.first, self.second, 5000)
+        self.assertEqual(self.first.get_balance, 1000)
+        self.assertEqual(self.second.get_balance, 1000)
+
+    def test_contention_counter(self):
+        self.assertEqual(self.locks.contention, 0)
+        self.assertEqual(len(self.locks.contention_by_stripe()), 8)
+
+    def test_waiting_acquisition_is_counted(self):
+        stripe = self.locks.stripe(self.first)
+        lock   = _SignallingLock(self.locks._locks[stripe])
+        self.locks._locks[stripe] = lock
+        worker = threading.Thread(target=self.locks.deposit, args=(self.first, 1))
+        with self.locks.locked(self.first):
+            worker.start()
+            self.assertTrue(lock.refused.wait(timeout=10))
+        worker.join(timeout=10)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(self.locks.contention, 1)
+        self.assertEqual(self.locks.contention_by_stripe()[stripe], 1)
+        self.assertEqual(self.first.get_balance, 1001)
+
+class _SignallingLock:
+
+    """A lock that signals when a non-blocking acquire finds it held."""
+
+    def __init__(self, lock) -> None:
+        self.lock    = lock
+        self.refused = threading.Event()
+
+    def acquire(self, blocking=True):
+        acquired = self.lock.acquire(blocking)
+        if not acquired:
+            self.refused.set()
+        return acquired
+
+    def release(self) -> None:
+        self.lock.release()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import random
+import unittest
+from itertools import count
+
+from bank_account.account import CurrentAccount
+from bank_account.history import BalanceHistory
+from bank_account.money import to_major
+from tests import TimerModeMixin
+
+class BalanceHistoryTest(TimerModeMixin, unittest.TestCase):
+    def test_attached_history_answers_point_in_time_queries(self):
+        clock   = count(10, 10).__next__
+        account = CurrentAccount('912379', 'sally jones', 117, -50)
+        history = BalanceHistory.attach(account, clock)
+        account.deposit(20)
+        account.withdraw(100)
+        account.try_withdraw(1000)
+        account.deposit(3)
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.balance_at(5), 117)
+        self.assertEqual(history.balance_at(10), 137)
+        self.assertEqual(history.balance_at(25), 37)
+        self.assertEqual(history.balance_at(10**9), account.get_balance)
+        self.assertEqual(history.sum_between(15, 30), -97)
+        history.detach(account)
+        account.deposit(1)
+        self.assertEqual(len(history), 3)
+
+    def test_matches_linear_scan(self):
+        rng     = random.Random(7)
+        history = BalanceHistory(500)
+        times   = sorted(rng.randrange(1000) for _ in range(300))
+        amounts = [rng.randrange(-1000, 1000) for _ in times]
+        for timestamp, amount in zip(times, amounts):
+            history.append(amount, timestamp)
+        history.correct(42, 250)
+        amounts[42] += 250
+        for timestamp in range(0, 1000, 37):
+            expected = 500 + sum(a for t, a in zip(times, amounts) if t <= timestamp)
+            self.assertEqual(history.minor_balance_at(timestamp), expected)
+        self.assertEqual(history.sum_between(100, 600),
+                         to_major(sum(a for t, a in zip(times, amounts) if 100 <= t <= 600)))
+
+    def test_out_of_order_posting_is_rejected(self):
+        history = BalanceHistory()
+        history.append(100, 20)
+        with self.assertRaises(ValueError):
+            history.append(100, 10)
+
+    def test_clock_stepping_back_does_not_fail_postings(self):
+        clock   = iter([20, 10, 30]).__next__
+        account = CurrentAccount('912379', 'sally jones', 117, -50)
+        history = BalanceHistory.attach(account, clock)
+        account.deposit(1)
+        account.deposit(2)
+        account.deposit(3)
+        self.assertEqual(list(history.times), [20, 20, 30])
+        self.assertEqual(history.balance_at(20), 120)
+        self.assertEqual(history.balance_at(30), account.get_balance)
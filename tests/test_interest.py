@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account.book import AccountBook
+from bank_account.interest import AccrualEngine
+
+class AccrualEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.book = AccountBook()
+        self.book.open('100001', 'jony smith', 365, 'deposit', interest_rate=0.1)
+        self.book.open('100002', 'jon ellis', 730, 'deposit', interest_rate=0.05)
+        self.book.open('100003', 'jon smith', 500, 'current', overdraft_limit=-100)
+
+    def test_simple_daily_accrual(self):
+        engine = AccrualEngine(self.book)
+        self.assertAlmostEqual(engine.accrue(), 20.0)
+        self.assertAlmostEqual(engine.accrued[0], 10.0)
+        self.assertEqual(engine.accrued[2], 0.0)
+
+    def test_day_count_convention(self):
+        engine = AccrualEngine(self.book, convention='ACT/360')
+        self.assertAlmostEqual(engine.accrue(days=36), 36500 * 0.1 / 10 + 73000 * 0.05 / 10)
+
+    def test_compounding(self):
+        engine = AccrualEngine(self.book, compounding=12)
+        engine.accrue(days=365)
+        self.assertAlmostEqual(engine.accrued[0], 36500 * ((1 + 0.1 / 12) ** 12 - 1))
+
+    def test_rate_tiers(self):
+        engine = AccrualEngine(self.book, tiers=[(0, 0.0), (500, 0.365)])
+        engine.accrue()
+        self.assertEqual(engine.accrued[0], 0.0)
+        self.assertAlmostEqual(engine.accrued[1], 73.0)
+
+    def test_post_capitalises_whole_minor_units(self):
+        self.book.open('100004', 'jim ellis', 100, 'deposit', interest_rate=0.00365)
+        engine = AccrualEngine(self.book)
+        engine.accrue()
+        engine.accrue()
+        self.assertEqual(engine.post(), 40)
+        self.assertEqual(self.book['100001'].get_balance, 365.2)
+        self.assertEqual(self.book['100004'].get_balance, 100)
+        self.assertAlmostEqual(engine.accrued[0], 0.0)
+        self.assertAlmostEqual(engine.accrued[3], 0.2)
+
+    def test_post_notifies_book_observers(self):
+        seen = []
+        self.book.observers = (lambda view, amount: seen.append((view.account_number, amount)),)
+        engine = AccrualEngine(self.book)
+        engine.accrue()
+        self.assertEqual(engine.post(), 20)
+        self.assertEqual(seen, [('100001', 10), ('100002', 10)])
+
+    def test_post_never_rounds_up(self):
+        self.book.open('100004', 'jim ellis', 100, 'deposit', interest_rate=0.00365)
+        engine = AccrualEngine(self.book)
+        for _ in range(6):
+            engine.accrue()
+        engine.post()
+        self.assertEqual(self.book['100004'].get_balance, 100)
+        self.assertAlmostEqual(engine.accrued[3], 0.6)
+
+    def test_incremental_accrual_picks_up_changes(self):
+        engine = AccrualEngine(self.book)
+        engine.accrue()
+        self.book['100001'].deposit(365)
+        self.book.open('100004', 'jim ellis', 365, 'deposit', interest_rate=0.1)
+        engine.accrue()
+        engine.accrue()
+        self.assertAlmostEqual(engine.accrued[0], 10.0 + 20.0 + 20.0)
+        self.assertAlmostEqual(engine.accrued[1], 30.0)
+        self.assertAlmostEqual(engine.accrued[3], 20.0)
+
+    def test_invalid_convention(self):
+        with self.assertRaises(ValueError):
+            AccrualEngine(self.book, convention='ACT/999')
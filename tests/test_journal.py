@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import os
+import tempfile
+import unittest
+
+from bank_account.account import Account, CurrentAccount
+from bank_account.book import AccountBook
+from bank_account.journal import Journal, RECORD, replay, replay_into
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_journal_records_account_postings(self):
+        account = CurrentAccount('789123', 'jon smith', 106, -100, [20, 30])
+        with Journal(self.path) as journal:
+            journal.attach(account)
+            account.deposit(50)
+            account.withdraw(20)
+            journal.detach(account)
+            account.deposit(1)
+        self.assertEqual(os.path.getsize(self.path), 2 * RECORD.size)
+        self.assertEqual(replay(self.path), {'789123': 3000})
+
+    def test_journal_group_commit(self):
+        journal = Journal(self.path, group_size=3)
+        for _ in range(4):
+            journal.append('123456', 1, 10)
+        self.assertEqual(os.path.getsize(self.path), 3 * RECORD.size)
+        journal.close()
+        self.assertEqual(os.path.getsize(self.path), 4 * RECORD.size)
+
+    def test_replay_ignores_torn_record(self):
+        with Journal(self.path) as journal:
+            journal.append('123456', 1, 10)
+            journal.append('123457', 2, 5)
+        with open(self.path, 'ab') as f:
+            f.write(b'\x00' * 5)
+        self.assertEqual(replay(self.path), {'123456': 10, '123457': -5})
+
+    def test_replay_empty_journal(self):
+        self.assertEqual(replay(self.path), {})
+
+    def test_replay_into_book(self):
+        book = AccountBook()
+        book.open('123456', 'John Smith', 100, 'savings')
+        with Journal(self.path) as journal:
+            journal.append('123456', 1, 1000)
+            journal.append('123456', 2, 3005)
+        replay_into(self.path, book)
+        self.assertEqual(book['123456'].get_balance, 79.95)
+
+    def test_journal_records_book_postings(self):
+        book = AccountBook()
+        book.open('123456', 'John Smith', 100, 'savings')
+        book.open('789123', 'jon smith', 106, 'current', overdraft_limit=-100)
+        with Journal(self.path) as journal:
+            journal.attach(book)
+            book['123456'].deposit(50)
+            book['789123'].withdraw(6)
+            book['789123'].try_withdraw(500)
+            book.post_batch(['123456', '789123', '999999'], [-20, 10, 5])
+            book['123456'].get_balance = 200
+            journal.detach(book)
+            book['123456'].deposit(1)
+        self.assertEqual(os.path.getsize(self.path), 5 * RECORD.size)
+        self.assertEqual(replay(self.path), {'123456': 10000, '789123': 400})
+
+        replayed = AccountBook()
+        replayed.open('123456', 'John Smith', 100, 'savings')
+        replayed.open('789123', 'jon smith', 106, 'current', overdraft_limit=-100)
+        replay_into(self.path, replayed)
+        self.assertEqual(replayed['123456'].get_balance, 200)
+        self.assertEqual(replayed['789123'].get_balance, book['789123'].get_balance)
+
+    def test_account_observers_default_empty(self):
+        self.assertEqual(Account.observers, ())
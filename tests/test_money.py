@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+from decimal import Decimal
+
+from bank_account.account import AmountError, CurrentAccount
+from bank_account.money import Money, to_minor, to_major
+import fintech.accounts as accounts
+
+class MoneyTest(unittest.TestCase):
+    def test_to_minor_is_exact(self):
+        self.assertEqual(to_minor(10), 1000)
+        self.assertEqual(to_minor(10.05), 1005)
+        self.assertEqual(to_minor('0.29'), 29)
+        self.assertEqual(to_minor(Decimal('-100.10')), -10010)
+        self.assertEqual(to_minor(Money(7)), 7)
+
+    def test_to_minor_rejects_sub_minor_precision(self):
+        with self.assertRaises(ValueError):
+            to_minor(0.001)
+        with self.assertRaises(ValueError):
+            to_minor('ten')
+
+    def test_to_major(self):
+        self.assertEqual(to_major(10400), 104)
+        self.assertIsInstance(to_major(10400), int)
+        self.assertEqual(to_major(1005), 10.05)
+
+    def test_money_rendering(self):
+        self.assertEqual(str(Money.of('10.05')), '10.05')
+        self.assertEqual(repr(Money(-5)), "Money('-0.05')")
+        self.assertEqual(Money.of(0.1).major, Decimal('0.1'))
+
+    def test_arithmetic_stays_money(self):
+        total = Money.of('1.50') + Money.of('1.00')
+        self.assertIs(type(total), Money)
+        self.assertEqual(total, 250)
+        self.assertEqual(Money(5) * 2, Money(10))
+        self.assertIs(type(3 * Money(5)), Money)
+        self.assertEqual(-Money(5), Money(-5))
+        self.assertIs(type(-Money(5)), Money)
+        self.assertEqual(abs(Money(-5)), Money(5))
+        self.assertIs(type(Money(5) - Money(7)), Money)
+        self.assertIs(type(Money(10) - Money(7)), Money)
+        self.assertIs(type(Money(7) // 2), Money)
+        self.assertEqual(sum([Money(1), Money(2), Money(3)]), Money(6))
+        self.assertIs(type(sum([Money(1), Money(2)])), Money)
+        with self.assertRaises(TypeError):
+            Money(5) * Money(5)
+
+class MoneyPostingTest(unittest.TestCase):
+    def test_plain_ints_do_not_mix_with_money(self):
+        for combine in (lambda: Money.of('1.50') + 1, lambda: 1 + Money(5),
+                        lambda: Money(5) - 1, lambda: 10 - Money(7)):
+            with self.assertRaises(TypeError):
+                combine()
+        self.assertEqual(Money(5) + 0, Money(5))
+
+    def test_summed_money_posts_minor_units(self):
+        account = accounts.CurrentAccount('123123', 'John smith', 10.05, -100.0)
+        account.deposit(Money.of('1.50') + Money.of('1.00'))
+        account.withdraw(-Money(-50))
+        self.assertEqual(account.minor_balance, 1005 + 250 - 50)
+
+    def test_fractional_postings_are_exact(self):
+        account = accounts.CurrentAccount('123123', 'John smith', 10.05, -100.0)
+        for _ in range(10):
+            account.deposit(Money.of('0.10'))
+        account.withdraw(Money.of('0.05'))
+        self.assertEqual(account.minor_balance, 1100)
+        self.assertEqual(account.get_balance, 11)
+
+    def test_float_amounts_are_still_rejected(self):
+        with self.assertRaises(AmountError):
+            CurrentAccount('789123', 'jon smith', 106, -100, []).deposit(0.5)
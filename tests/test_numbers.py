@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account import core
+from bank_account.account import Account, DepositAccount, InvestmentAccount
+from bank_account.numbers import AccountNumberRegistry
+import fintech.accounts as accounts
+
+class AccountNumberRegistryTest(unittest.TestCase):
+    def test_claim_and_release(self):
+        registry = AccountNumberRegistry(['000001'])
+        self.assertIn('000001', registry)
+        with self.assertRaises(ValueError):
+            registry.claim('000001')
+        registry.release('000001')
+        self.assertNotIn('000001', registry)
+        self.assertEqual(len(registry), 0)
+        with self.assertRaises(ValueError):
+            registry.release('000001')
+
+    def test_numbers_outside_the_number_space(self):
+        registry = AccountNumberRegistry(['999999'])
+        for number in (-1, '-1', 1_000_000):
+            self.assertNotIn(number, registry)
+            with self.assertRaises(ValueError):
+                registry.release(number)
+        self.assertEqual(len(registry), 1)
+
+    def test_allocate_skips_used_numbers(self):
+        registry = AccountNumberRegistry(['000000', '000002'])
+        self.assertEqual(registry.allocate(3), ['000001', '000003', '000004'])
+        registry.release('000001')
+        self.assertEqual(registry.allocate(), ['000001'])
+        self.assertEqual(len(registry), 5)
+        self.assertEqual(registry.occupancy, 5 / 1_000_000)
+
+    def test_allocate_beyond_capacity(self):
+        registry = AccountNumberRegistry()
+        self.assertEqual(len(registry.allocate(1_000_000)), 1_000_000)
+        self.assertEqual(registry.free, 0)
+        with self.assertRaises(ValueError):
+            registry.allocate()
+
+    def test_collisions(self):
+        registry = AccountNumberRegistry(['891234'])
+        self.assertEqual(registry.collisions(['891234', '912372', '912372']), ['891234', '912372'])
+        self.assertEqual(len(registry), 1)
+
+class UniqueConstructionTest(unittest.TestCase):
+    def setUp(self):
+        core.Account.numbers = AccountNumberRegistry()
+
+    def tearDown(self):
+        core.Account.numbers = None
+
+    def test_duplicates_are_rejected_across_facades(self):
+        DepositAccount('891234', 'jony smith', 109, 1.05)
+        with self.assertRaises(ValueError):
+            InvestmentAccount('891234', 'jony smith', 109, 'high')
+        with self.assertRaises(ValueError):
+            accounts.InvestmentAccount('891234', 'jony smith', 109, 'high')
+        self.assertEqual(len(core.Account.numbers), 1)
+
+    def test_invalid_account_does_not_claim(self):
+        with self.assertRaises(ValueError):
+            Account('567891', 'jane dole', -1, 'savings')
+        self.assertNotIn('567891', core.Account.numbers)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account.account import Account, CurrentAccount
+from bank_account.overdraft import OverdraftScanner
+from tests import TimerModeMixin
+
+class OverdraftScannerTest(TimerModeMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.sally   = CurrentAccount('912379', 'sally jones', 117, -50)
+        self.jon     = CurrentAccount('891237', 'jon jones', 115, -1500)
+        self.smith   = CurrentAccount('789123', 'jon smith', 106, -1000)
+        self.scanner = OverdraftScanner([self.sally, self.jon, self.smith])
+
+    def test_accounts_are_ranked_by_headroom(self):
+        self.assertEqual(self.scanner.headroom(self.sally), 167)
+        self.assertEqual(self.scanner.top_k(2), [self.sally, self.smith])
+        self.assertEqual(self.scanner.below(1106), [self.sally, self.smith])
+
+    def test_postings_rerank_accounts(self):
+        self.smith.withdraw(1000)
+        self.sally.deposit(100)
+        self.assertEqual(self.scanner.top_k(3), [self.smith, self.sally, self.jon])
+        self.assertEqual(self.scanner.below(106), [self.smith])
+        self.scanner.remove(self.smith)
+        self.smith.deposit(1)
+        self.assertEqual(self.scanner.below(300), [self.sally])
+
+    def test_attached_class_scans_new_current_accounts(self):
+        scanner = OverdraftScanner()
+        scanner.attach(CurrentAccount)
+        try:
+            account = CurrentAccount('123123', 'John smith', 10, -100)
+            Account('567891', 'jane dole', 104, 'savings')
+            account.withdraw(105)
+        finally:
+            scanner.detach(CurrentAccount)
+        self.assertEqual(len(scanner), 1)
+        self.assertEqual(scanner.headroom(account), 5)
+
+    def test_only_current_accounts_are_scanned(self):
+        with self.assertRaises(ValueError):
+            self.scanner.add(Account('567891', 'jane dole', 104, 'savings'))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account import slotted
+from bank_account.account import Account, CurrentAccount, InvestmentAccount
+from bank_account.book import AccountBook
+from bank_account.registry import AccountRegistry, SortedIndex
+from tests import TimerModeMixin
+
+class SortedIndexTest(unittest.TestCase):
+    def test_sorted_index_orders_and_updates(self):
+        index = SortedIndex()
+        for key, item in ((5, 'a'), (1, 'b'), (5, 'c'), (3, 'd')):
+            index.insert(key, item)
+        self.assertEqual(index.between(), ['b', 'd', 'a', 'c'])
+        self.assertEqual(index.between(3, 5), ['d', 'a', 'c'])
+        index.update(0, 'c')
+        self.assertEqual(index.first(2), ['c', 'b'])
+        index.remove('b')
+        self.assertEqual(len(index), 3)
+
+class AccountRegistryTest(TimerModeMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.savings = Account('100001', 'jane dole', 100, 'savings')
+        self.current = CurrentAccount('100002', 'jane dole', 250, -100)
+        self.high    = InvestmentAccount('100003', 'jim ellis', 500, 'high')
+        self.low     = InvestmentAccount('100004', 'jim ellis', 50, 'low')
+        self.registry = AccountRegistry([self.savings, self.current, self.high, self.low])
+
+    def test_hash_indexes(self):
+        self.assertEqual(self.registry.by_holder('jane dole'), {self.savings, self.current})
+        self.assertEqual(self.registry.by_type('investment'), {self.high, self.low})
+        self.assertEqual(self.registry.find(account_type='investment', risk_level='high'), {self.high})
+        self.assertEqual(self.registry.find(account_holder='jim ellis', risk_level='medium'), set())
+
+    def test_balance_range_follows_postings(self):
+        self.assertEqual(self.registry.balance_between(90, 300), [self.savings, self.current])
+        self.savings.deposit(300)
+        self.current.withdraw(200)
+        self.assertEqual(self.registry.balance_between(high=60), [self.low, self.current])
+        self.assertEqual(self.registry.balance_between(low=400), [self.savings, self.high])
+
+    def test_remove_detaches_observer(self):
+        self.registry.remove(self.savings)
+        self.savings.deposit(1)
+        self.assertNotIn(self.savings, self.registry)
+        self.assertEqual(self.savings.subscribers, ())
+        self.assertEqual(len(self.registry), 3)
+
+    def test_duplicate_registration_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.registry.add(self.savings)
+
+    def test_class_observers_attached_later_still_apply(self):
+        seen = []
+        observer = lambda account, amount: seen.append((account.account_number, amount))
+        CurrentAccount.observers = CurrentAccount.observers + (observer,)
+        try:
+            self.current.deposit(1)
+        finally:
+            CurrentAccount.observers = tuple(o for o in CurrentAccount.observers if o != observer)
+        self.assertEqual(seen, [('100002', 100)])
+        self.assertEqual(self.registry.balance_between(251, 251), [self.current])
+
+    def test_slotted_accounts_and_book_views_can_register(self):
+        account = slotted.CurrentAccount('100005', 'jane dole', 10, -100, [])
+        book = AccountBook()
+        book.open('100006', 'jim ellis', 20, 'savings')
+        registry = AccountRegistry([account, book['100006']])
+        account.withdraw(50)
+        book['100006'].deposit(30)
+        self.assertEqual(registry.balance_between(), [account, book['100006']])
+        registry.remove(book['100006'])
+        self.assertEqual(book['100006'].subscribers, ())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import asyncio
+import json
+import unittest
+
+from bank_account.account import AmountError, BalanceError
+from bank_account.book import AccountBook
+from bank_account.service import AccountService
+
+class AccountServiceTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.book = AccountBook()
+        self.book.open('123456', 'John Smith', 100, 'savings')
+        self.book.open('789123', 'jon smith', 106, 'current', overdraft_limit=-100)
+        self.service = AccountService(self.book)
+
+    async def test_concurrent_requests_are_coalesced(self):
+        await asyncio.gather(*(self.service.deposit('123456', 1) for _ in range(50)))
+        self.assertEqual(await self.service.get_balance('123456'), 150)
+        self.assertEqual(self.service.batches, 2)
+
+    async def test_balance_sees_earlier_postings_in_batch(self):
+        _, balance = await asyncio.gather(self.service.withdraw('123456', 30),
+                                          self.service.get_balance('123456'))
+        self.assertEqual(balance, 70)
+
+    async def test_rejections_raise_per_request(self):
+        results = await asyncio.gather(self.service.withdraw('789123', 500),
+                                       self.service.deposit('123456', 10),
+                                       return_exceptions=True)
+        self.assertIsInstance(results[0], BalanceError)
+        self.assertIsNone(results[1])
+        with self.assertRaises(AmountError):
+            await self.service.deposit('123456', -5)
+        with self.assertRaises(KeyError):
+            await self.service.deposit('654321', 5)
+
+    async def test_cancelled_requests_are_not_posted(self):
+        cancelled = asyncio.create_task(self.service.deposit('123456', 50))
+        kept      = asyncio.create_task(self.service.deposit('123456', 5))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await kept
+        self.assertTrue(cancelled.cancelled())
+        self.assertEqual(await self.service.get_balance('123456'), 105)
+
+    async def test_book_errors_reach_every_waiting_request(self):
+        service = AccountService(self.book, max_pending=2)
+        def broken(*args, **kwargs):
+            raise RuntimeError("book unavailable")
+        service.book.post_batch = broken
+        results = await asyncio.wait_for(asyncio.gather(service.deposit('123456', 1),
+                                                        service.get_balance('123456'),
+                                                        service.withdraw('789123', 1),
+                                                        return_exceptions=True), 1)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+        del service.book.post_batch
+        await asyncio.wait_for(service.deposit('123456', 1), 1)
+        self.assertEqual(await service.get_balance('123456'), 101)
+
+    async def test_json_lines_server(self):
+        server = await self.service.serve(port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            for request in ({'op': 'deposit', 'account': '123456', 'amount': 5},
+                            {'op': 'withdraw', 'account': '789123', 'amount': 500},
+                            {'op': 'balance', 'account': '123456'}):
+                writer.write(json.dumps(request).encode() + b'\n')
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(3)]
+            writer.close()
+            await writer.wait_closed()
+        self.assertEqual(responses, [{'ok': True},
+                                     {'ok': False, 'error': 'BalanceError'},
+                                     {'ok': True, 'balance': 105}])
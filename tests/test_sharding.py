@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account.account import CurrentAccount, DepositAccount, InvestmentAccount, PostingStatus
+from bank_account.money import Money
+from bank_account.sharding import ShardedLedger
+
+class ShardedLedgerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ledger = ShardedLedger(shards=2, capacity=4)
+        cls.ledger.open(CurrentAccount('100001', 'jon smith', 100, -100, []))
+        cls.ledger.open(CurrentAccount('100002', 'sam jones', 100, 0, []))
+        cls.ledger.open(DepositAccount('100003', 'jony ellis', 200, 0.5, []))
+        cls.ledger.open(InvestmentAccount('100004', 'jim ellis', 300, 'high', []))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ledger.close()
+
+    def test_a_post_batch_routes_to_shards(self):
+        numbers = ['100001', '100002', '100003', '100004', '100002', '999999'] * 2
+        amounts = [10, -50, 20, -30, -100, 5] * 2
+        status  = self.ledger.post_batch(numbers, amounts)
+        self.assertEqual(list(status[:6]), [PostingStatus.POSTED,
+                                            PostingStatus.POSTED,
+                                            PostingStatus.POSTED,
+                                            PostingStatus.POSTED,
+                                            PostingStatus.OVERDRAFT_LIMIT,
+                                            PostingStatus.UNKNOWN_ACCOUNT])
+        self.assertEqual(self.ledger.get_balance('100001'), 120)
+        self.assertEqual(self.ledger.get_balance('100002'), 0)
+
+    def test_b_totals_by_type(self):
+        self.assertEqual(self.ledger.totals_by_type(), {'current': 120, 'deposit': 240, 'investment': 240})
+        self.assertEqual(self.ledger.count(), 4)
+
+    def test_c_out_of_range_rows_are_rejected_before_sending(self):
+        status = self.ledger.post_batch(['100001', '100002', '-1'], [Money(2**63), 0, 5])
+        self.assertEqual(list(status), [PostingStatus.INVALID_AMOUNT,
+                                        PostingStatus.INVALID_AMOUNT,
+                                        PostingStatus.UNKNOWN_ACCOUNT])
+        self.assertEqual(self.ledger.count(), 4)
+
+    def test_d_failed_send_still_drains_replies(self):
+        write = self.ledger._write
+        def fail_second_shard(shard, numbers, amounts):
+            if shard == 1:
+                raise OSError('buffer unavailable')
+            write(shard, numbers, amounts)
+        self.ledger._write = fail_second_shard
+        try:
+            with self.assertRaises(OSError):
+                self.ledger.post_batch(['100002', '100001'], [1, 1])
+        finally:
+            del self.ledger._write
+        self.assertEqual(self.ledger.count(), 4)
+        self.assertEqual(self.ledger.get_balance('100002'), 1)
+
+    def test_duplicate_account_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.ledger.open(CurrentAccount('100001', 'jon smith', 100, -100, []))
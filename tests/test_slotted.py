@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account.account import AmountError, BalanceError
+from bank_account.slotted import Account, CurrentAccount, DepositAccount, InvestmentAccount
+
+class SlottedAccountTest(unittest.TestCase):
+    def test_slotted_account_has_no_instance_dict(self):
+        account = Account('567891', 'jane dole', 104, 'savings', [20, 30])
+        self.assertFalse(hasattr(account, '__dict__'))
+
+    def test_slotted_account_representations_match(self):
+        self.assertEqual(str(Account('567891', 'jane dole', 104, 'savings', [])),
+                         "Account[567891] - jane dole, savings account = 104")
+        self.assertEqual(repr(CurrentAccount('891237', 'jon jones', 115, 1500, [])),
+                         "CurrentAccount('891237', 'jon jones', 115, 1500)")
+        self.assertEqual(str(DepositAccount('891234', 'jony smith', 109, 0.5, [])),
+                         "DepositAccount[891234] - jony smith, account = 109, interest rate = 0.5")
+        self.assertEqual(repr(InvestmentAccount('123729', 'jonny ellis', 121, 'low', [])),
+                         "InvestmentAccount('123729', 'jonny ellis', 121, low)")
+
+    def test_slotted_account_postings(self):
+        account = CurrentAccount('123796', 'sam jones', 179, -100, [20, 30])
+        account.deposit(21)
+        account.withdraw(100)
+        self.assertEqual(account.get_balance, 100)
+        self.assertEqual(list(account), [20, 30])
+        with self.assertRaises(AmountError):
+            account.deposit(-1)
+        with self.assertRaises(BalanceError):
+            account.withdraw(500)
+
+    def test_slotted_deposit_interest(self):
+        account = DepositAccount('123729', 'jony ellis', 132, 0.5, [])
+        self.assertEqual(account.interest(), 66.0)
+
+    def test_slotted_investment_risk_level_is_validated(self):
+        with self.assertRaises(ValueError):
+            InvestmentAccount('767891', 'jonathan dole', 94, 'super high', [])
+
+    def test_typo_raises_attribute_error_with_hint(self):
+        account = CurrentAccount('789123', 'jon smith', 106, 1000, [])
+        with self.assertRaisesRegex(AttributeError, "overdraft_limit"):
+            account.overdraft_limt
+        with self.assertRaises(AttributeError):
+            account.overdraft_limt = 5
+        self.assertEqual(account.overdraft_limit, 1000)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import os
+import tempfile
+import unittest
+
+from bank_account.book import AccountBook
+from bank_account.snapshot import Checkpointer, load
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        self.book = AccountBook()
+        self.book.open('123456', 'John Smith', 100, 'savings')
+        self.book.open('789123', 'jon smith', 106, 'current', overdraft_limit=-100)
+        self.book.open('891234', 'jony smith', 109, 'deposit', interest_rate=0.5)
+        self.book.open('912347', 'jonny jones', 115, 'investment', risk_level='high')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_snapshot_round_trip(self):
+        Checkpointer(self.book, self.path).snapshot()
+        loaded = load(self.path)
+        self.assertEqual([repr(view) for view in loaded], [repr(view) for view in self.book])
+        self.assertEqual(loaded['789123'].overdraft_limit, -100)
+        self.assertEqual(loaded['891234'].interest_rate, 0.5)
+        self.assertEqual(loaded['912347'].risk_level, 'high')
+
+    def test_checkpoint_writes_only_changed_rows(self):
+        checkpointer = Checkpointer(self.book, self.path)
+        self.assertEqual(checkpointer.checkpoint(), 4)
+        self.book['123456'].deposit(20)
+        self.book.open('567891', 'jane dole', 104, 'savings')
+        self.assertEqual(checkpointer.checkpoint(), 2)
+        self.assertEqual(checkpointer.checkpoint(), 0)
+
+        loaded = load(self.path)
+        self.assertEqual(len(loaded), 5)
+        self.assertEqual(loaded['123456'].get_balance, 120)
+        self.assertEqual(loaded['567891'].account_holder, 'jane dole')
+
+    def test_holders_with_newlines_round_trip(self):
+        self.book.open('567891', 'jane dole\nmary ann', 104, 'savings')
+        checkpointer = Checkpointer(self.book, self.path)
+        checkpointer.checkpoint()
+        self.book.open('567892', 'june dole\n', 10, 'savings')
+        checkpointer.checkpoint()
+
+        loaded = load(self.path)
+        self.assertEqual(len(loaded), 6)
+        self.assertEqual(loaded['567891'].account_holder, 'jane dole\nmary ann')
+        self.assertEqual(loaded['567892'].account_holder, 'june dole\n')
+        self.assertEqual(loaded['912347'].account_holder, 'jonny jones')
+
+    def test_load_rejects_foreign_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'\x00' * 32)
+        with self.assertRaises(ValueError):
+            load(self.path)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+from itertools import count, islice
+
+from bank_account.account import Account
+from bank_account.streams import running_balance, rolling_sum, rolling_min, rolling_max
+from bank_account.streams import credits, debits, between
+
+class AccountIterationTest(unittest.TestCase):
+    def test_account_iterators_are_independent(self):
+        account = Account('567891', 'jane dole', 104, 'savings', [20, -30, 40])
+        first, second = iter(account), iter(account)
+        self.assertEqual(next(first), 20)
+        self.assertEqual(list(second), [20, -30, 40])
+        self.assertEqual(list(first), [-30, 40])
+        self.assertEqual(list(account), [20, -30, 40])
+
+class StreamsTest(unittest.TestCase):
+    amounts = [20, -30, 40, -10, 5]
+
+    def test_running_balance(self):
+        self.assertEqual(list(running_balance(self.amounts, 100)), [120, 90, 130, 120, 125])
+
+    def test_rolling_sum(self):
+        self.assertEqual(list(rolling_sum(self.amounts, 2)), [20, -10, 10, 30, -5])
+
+    def test_rolling_min_and_max(self):
+        self.assertEqual(list(rolling_min(self.amounts, 3)), [20, -30, -30, -30, -10])
+        self.assertEqual(list(rolling_max(self.amounts, 3)), [20, 20, 40, 40, 40])
+
+    def test_filters(self):
+        self.assertEqual(list(credits(self.amounts)), [20, 40, 5])
+        self.assertEqual(list(debits(self.amounts)), [-30, -10])
+        self.assertEqual(list(between(self.amounts, 10, 30)), [20, -30, -10])
+
+    def test_operators_are_lazy(self):
+        self.assertEqual(list(islice(rolling_max(count(), 3), 4)), [0, 1, 2, 3])
+
+    def test_window_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            list(rolling_sum(self.amounts, 0))
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account.account import Account, CurrentAccount, AmountError, BalanceError
+from bank_account.book import AccountBook
+from bank_account.unit_of_work import UnitOfWork
+import fintech.accounts as accounts
+from tests import TimerModeMixin
+
+class UnitOfWorkTest(TimerModeMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.current = CurrentAccount('912379', 'sally jones', 117, -50)
+        self.savings = Account('567891', 'jane dole', 104, 'savings')
+
+    def test_postings_apply_on_exit(self):
+        seen = []
+        self.savings.subscribe(lambda account, amount: seen.append(amount))
+        with UnitOfWork() as work:
+            work.transfer(self.current, self.savings, 150)
+            work.withdraw(self.savings, 4)
+            self.assertEqual(work.minor_balance(self.savings), 25000)
+            self.assertEqual(self.savings.get_balance, 104)
+        self.assertEqual(self.current.get_balance, -33)
+        self.assertEqual(self.savings.get_balance, 250)
+        self.assertEqual(seen, [15000, -400])
+
+    def test_failed_leg_applies_nothing(self):
+        with self.assertRaises(BalanceError):
+            with UnitOfWork() as work:
+                work.withdraw(self.current, 100)
+                work.deposit(self.savings, 100)
+                work.withdraw(self.current, 100)
+        with self.assertRaises(AmountError):
+            with UnitOfWork() as work:
+                work.deposit(self.savings, 10)
+                work.deposit(self.current, -10)
+        self.assertEqual((self.current.get_balance, self.savings.get_balance), (117, 104))
+
+    def test_exception_in_block_discards_postings(self):
+        with self.assertRaises(KeyError):
+            with UnitOfWork() as work:
+                work.deposit(self.savings, 10)
+                raise KeyError('boom')
+        self.assertEqual(self.savings.get_balance, 104)
+
+    def test_failing_observer_rolls_back(self):
+        def refuse(account, amount):
+            raise RuntimeError('journal unavailable')
+        self.current.subscribe(refuse)
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork() as work:
+                work.deposit(self.savings, 10)
+                work.deposit(self.current, 10)
+        self.assertEqual((self.current.get_balance, self.savings.get_balance), (117, 104))
+
+    def test_failing_observer_reverses_observers_that_ran(self):
+        seen = []
+        def record(account, amount):
+            seen.append((account.account_number, amount, account.minor_balance))
+        def refuse(account, amount):
+            if amount > 0:
+                raise RuntimeError('journal unavailable')
+        self.current.subscribe(record)
+        self.savings.subscribe(record)
+        self.savings.subscribe(refuse)
+        with self.assertRaises(RuntimeError):
+            with UnitOfWork() as work:
+                work.transfer(self.current, self.savings, 10)
+        self.assertEqual((self.current.get_balance, self.savings.get_balance), (117, 104))
+        self.assertEqual(seen, [('912379', -1000, 10700), ('567891', 1000, 11400),
+                                ('567891', -1000, 10400), ('912379', 1000, 11700)])
+
+    def test_book_views_are_rejected(self):
+        book = AccountBook()
+        with self.assertRaises(TypeError):
+            UnitOfWork().deposit(book.open('100001', 'jane dole', 10, 'savings'), 5)
+
+class FintechContextManagerTest(unittest.TestCase):
+    def test_with_block_is_a_unit_of_work(self):
+        source = accounts.CurrentAccount('123123', 'John smith', 10.05, -100.0)
+        target = accounts.DepositAccount('345123', 'John saul', 23.55, 0.5)
+        with source as pending:
+            pending.withdraw(50)
+            pending.transfer(target, 10)
+            self.assertEqual(pending.get_balance, -49.95)
+            self.assertEqual(source.get_balance, 10.05)
+        self.assertEqual(source.get_balance, -49.95)
+        self.assertEqual(target.get_balance, 33.55)
+
+    def test_try_postings_are_buffered(self):
+        source = accounts.CurrentAccount('123123', 'John smith', 10.05, -100.0)
+        with self.assertRaises(AmountError):
+            with source as pending:
+                self.assertIs(pending.try_withdraw(50), accounts.PostingStatus.POSTED)
+                self.assertIs(pending.try_withdraw(100), accounts.PostingStatus.OVERDRAFT_LIMIT)
+                self.assertIs(pending.try_deposit(-1), accounts.PostingStatus.INVALID_AMOUNT)
+                self.assertEqual(pending.get_balance, -39.95)
+                pending.deposit(-1)
+        self.assertEqual(source.get_balance, 10.05)
+        with source as pending:
+            pending.try_withdraw(50)
+        self.assertEqual(source.get_balance, -39.95)
+
+    def test_exit_without_enter(self):
+        source = accounts.CurrentAccount('123123', 'John smith', 10.05, -100.0)
+        with self.assertRaises(RuntimeError):
+            source.__exit__(None, None, None)
+
+    def test_with_block_no_longer_swallows_exceptions(self):
+        source = accounts.CurrentAccount('123123', 'John smith', 10.05, -100.0)
+        with self.assertRaises(BalanceError):
+            with source as pending:
+                pending.withdraw(500)
+        with self.assertRaises(ZeroDivisionError):
+            with source as pending:
+                pending.deposit(5)
+                1 / 0
+        self.assertEqual(source.get_balance, 10.05)
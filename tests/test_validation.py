@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+from bank_account import validation
+from bank_account.validation import validate, validate_many, enable_holder_cache, disable_holder_cache
+
+class ValidationTest(unittest.TestCase):
+    def test_validate_accepts_valid_record(self):
+        self.assertIsNone(validate('123456', 'John Smith', 100, 'deposit'))
+
+    def test_validate_account_number_type(self):
+        with self.assertRaises(TypeError):
+            validate(123456, 'John Smith', 100, 'deposit')
+
+    def test_validate_account_number_digits_and_length(self):
+        with self.assertRaises(ValueError):
+            validate('A23456', 'John Smith', 100, 'deposit')
+        with self.assertRaises(ValueError):
+            validate('1234567', 'John Smith', 100, 'deposit')
+
+    def test_validate_holder_name(self):
+        with self.assertRaises(ValueError):
+            validate('123456', 'jane.dole@gmail.com', 100, 'deposit')
+
+    def test_validate_many_reports_every_failure(self):
+        failures = validate_many([
+            ('123456', 'John Smith', 100, 'deposit'),
+            (123456, 'John Smith', 100, 'deposit'),
+            ('123456', 'John Smith', -1, 'deposit'),
+            ('123456', 'John Smith', 100, 'practice'),
+            ('123456', 'John Smith', 'abc', 'deposit'),
+            ('123456', None, 100, 'deposit'),
+        ])
+        self.assertEqual([index for index, _ in failures], [1, 2, 3, 4, 5])
+        self.assertIsInstance(failures[0][1], TypeError)
+        self.assertIsInstance(failures[2][1], ValueError)
+        self.assertIsInstance(failures[3][1], TypeError)
+        self.assertIsInstance(failures[4][1], TypeError)
+
+    def test_holder_cache(self):
+        enable_holder_cache(maxsize=16)
+        try:
+            validate('123456', 'John Smith', 100, 'deposit')
+            validate('123457', 'John Smith', 100, 'deposit')
+            self.assertEqual(validation._holder_match.cache_info().hits, 1)
+            with self.assertRaises(ValueError):
+                validate('123456', 'jane.dole@gmail.com', 100, 'deposit')
+        finally:
+            disable_holder_cache()
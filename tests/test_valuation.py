@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+#
+# Usage: .py
+#
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from bank_account.book import AccountBook
+
+@unittest.skipUnless(numpy, 'valuation requires NumPy')
+class ValuationEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.book = AccountBook()
+        self.book.open('123456', 'John Smith', 100, 'savings')
+        self.book.open('891234', 'jony smith', 1000, 'investment', risk_level='high')
+        self.book.open('912372', 'jon ellis', 2000, 'investment', risk_level='medium')
+        self.book.open('123729', 'jony ellis', 4000, 'investment', risk_level='low')
+        self.book.open('912347', 'jonny jones', 500, 'investment', risk_level='high')
+
+    def _engine(self, **kwargs):
+        from bank_account.valuation import ValuationEngine
+        return ValuationEngine(self.book, seed=11, **kwargs)
+
+    def test_mark_applies_returns_per_risk_level(self):
+        marked = self._engine().mark({'high': -0.2, 'low': 0.01})
+        self.assertEqual(list(marked['numbers']), [891234, 912372, 123729, 912347])
+        numpy.testing.assert_allclose(marked['values'], [800, 2120, 4040, 400])
+        self.assertEqual(marked['buckets'], {'low': 4040.0, 'medium': 2120.0, 'high': 1200.0})
+
+    def test_chunking_does_not_change_results(self):
+        whole   = self._engine().simulate(paths=2000)
+        chunked = self._engine(memory_budget=8 * 9 * 7).simulate(paths=2000)
+        self.assertEqual(self._engine(memory_budget=8 * 9 * 7).chunk_size(), 7)
+        self.assertAlmostEqual(whole['total']['var'], chunked['total']['var'])
+        numpy.testing.assert_allclose(whole['accounts']['var'], chunked['accounts']['var'])
+
+    def test_var_per_account_and_bucket(self):
+        result = self._engine(correlation=1.0).simulate(paths=5000, confidence=0.95)
+        var    = dict(zip(result['accounts']['numbers'], result['accounts']['var']))
+        self.assertGreater(var[891234] / 1000, var[123729] / 4000)
+        self.assertAlmostEqual(var[891234] / 1000, var[912347] / 500)
+        # Fully correlated accounts at one level move together, so the bucket
+        # VaR is the sum of its accounts' VaR.
+        self.assertAlmostEqual(result['buckets']['high']['var'], var[891234] + var[912347])
+        self.assertEqual(result['buckets']['medium']['value'], 2000)
+        percentiles = result['total']['percentiles']
+        self.assertLess(percentiles[1], percentiles[50])
+        self.assertLess(percentiles[50], percentiles[99])
+        self.assertLessEqual(result['total']['var'], sum(var.values()) + 1e-9)
+
+    def test_invalid_scenario(self):
+        with self.assertRaises(ValueError):
+            self._engine(scenarios={'extreme': (0.5, 0.9)})